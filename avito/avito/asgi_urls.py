@@ -0,0 +1,15 @@
+"""
+URL configuration for avito project under ASGI.
+
+Same routes as avito/urls.py, but read endpoints of the API are served by async views.
+"""
+from django.contrib import admin
+from django.urls import include, path
+
+from tenders.views import PrometheusMetricsAPIView
+
+urlpatterns = [
+    path('admin/', admin.site.urls),
+    path('metrics', PrometheusMetricsAPIView.as_view(), name='metrics'),
+    path('api/', include('tenders.async_urls')),
+]
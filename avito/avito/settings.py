@@ -10,8 +10,11 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/4.2/ref/settings/
 """
 
+import os
 from pathlib import Path
 
+from .database import database_from_env, replicas_from_env
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -37,6 +40,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
 
     "tenders.apps.TendersConfig",
 
@@ -46,6 +50,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'tenders.middleware.MetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -53,9 +58,11 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'tenders.middleware.ReplicaRoutingMiddleware',
 ]
 
-ROOT_URLCONF = 'avito.urls'
+# Под ASGI (avito/asgi.py) чтение API обслуживают async-представления
+ROOT_URLCONF = 'avito.asgi_urls' if os.environ.get('DJANGO_ASYNC_API') == '1' else 'avito.urls'
 
 TEMPLATES = [
     {
@@ -86,24 +93,77 @@ WSGI_APPLICATION = 'avito.wsgi.application'
 #     }
 # }
 
+# Подключение настраивается переменными окружения POSTGRES_CONN и POSTGRES_* (avito/database.py)
 DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.postgresql',
-        'NAME': 'db',
-        'USER': 'postgres',
-        'PASSWORD': '22nehili',
-        'HOST': '127.0.0.1',
-        'PORT': 5432,
-    }
+    'default': database_from_env(os.environ),
 }
+# Реплики для чтения из POSTGRES_REPLICA_HOSTS, после записи пользователь читает из основной базы
+# REPLICA_STICKY_SECONDS секунд (tenders/routers.py)
+DATABASES.update(replicas_from_env(os.environ, DATABASES['default']))
+DATABASE_ROUTERS = ['tenders.routers.ReplicaRouter']
+REPLICA_STICKY_SECONDS = int(os.environ.get('REPLICA_STICKY_SECONDS', 5))
 
 REST_FRAMEWORK = {
     "DEFAULT_FILTER_BACKENDS": [
         "django_filters.rest_framework.DjangoFilterBackend",
     ],
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.LimitOffsetPagination',
-    "PAGE_SIZE": 5
+    "PAGE_SIZE": 5,
+    # JSON через orjson (tenders/renderers.py, tenders/parsers.py), без orjson работают стандартные классы DRF
+    "DEFAULT_RENDERER_CLASSES": [
+        "tenders.renderers.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "tenders.parsers.FastJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
+}
+
+# Кэш пользователей и их организаций внутри процесса (tenders/cache.py)
+IDENTITY_CACHE_SIZE = 4096
+IDENTITY_CACHE_TTL = 60
+
+# Бюджет SQL-запросов на один HTTP-запрос без точек сохранения, при превышении MetricsMiddleware пишет предупреждение.
+# QUERY_BUDGETS задает бюджет маршрутов по имени из tenders/urls.py: число запросов при холодных кэшах
+# в самом дорогом сценарии маршрута среди всех его методов, их же проверяют тесты.
+# QUERY_BUDGET - для маршрутов без своего бюджета
+QUERY_BUDGET = int(os.environ.get('QUERY_BUDGET', 10))
+QUERY_BUDGETS = {
+    'ping': 0,
+    'metrics_db': 1,
+    'metrics_cache': 0,
+    'tenders': 1,
+    'tenders_export': 1,
+    'tenders_new': 3,
+    'tenders_bulk': 3,
+    # PUT: чтение, пользователь, условный UPDATE и запись версии
+    'tenders_status': 4,
+    'tenders_edit': 4,
+    'tenders_rollback': 5,
+    'tenders_history': 3,
+    'tenders_my': 2,
+    'bids_new': 4,
+    'bids_bulk': 4,
+    'bids_my': 2,
+    'bids_list': 3,
+    'bids_export': 3,
+    # PUT: чтение, пользователь, условный UPDATE и запись версии
+    'bids_status': 4,
+    'bids_edit': 4,
+    # Согласование по кворуму: решение, закрытие тендера и отмена остальных предложений
+    'bids_decision': 13,
+    'bids_feedback': 3,
+    'bids_rollback': 5,
+    'bids_history': 3,
+    'bids_reviews': 5,
 }
+# Кэш страниц публичного списка тендеров, сбрасывается сменой поколения при любой записи тендера
+TENDER_LIST_CACHE = 'default'
+TENDER_LIST_CACHE_TTL = int(os.environ.get('TENDER_LIST_CACHE_TTL', 300))
+# Выгрузки /tenders/export и /bids/<id>/export читают строки серверным курсором пачками по EXPORT_CHUNK_SIZE
+EXPORT_CHUNK_SIZE = int(os.environ.get('EXPORT_CHUNK_SIZE', 2000))
 
 
 # Password validation
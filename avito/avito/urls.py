@@ -15,8 +15,12 @@ Including another URLconf
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
 from django.contrib import admin
-from django.urls import path
+from django.urls import include, path
+
+from tenders.views import PrometheusMetricsAPIView
 
 urlpatterns = [
     path('admin/', admin.site.urls),
+    path('metrics', PrometheusMetricsAPIView.as_view(), name='metrics'),
+    path('api/', include('tenders.urls')),
 ]
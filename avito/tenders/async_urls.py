@@ -0,0 +1,19 @@
+from django.urls import path
+
+from . import urls
+from .async_views import AsyncPingView, AsyncTendersView, AsyncUserTendersView, AsyncTendersStatusView, \
+    AsyncBidsMyView, AsyncBidsTendersListView, AsyncBidsStatusView, AsyncTendersExportView, AsyncBidsExportView
+
+# Маршруты для ASGI: чтение обслуживают async-представления, остальное берется из urls.py
+urlpatterns = [
+    path("ping", AsyncPingView.as_view(), name="ping"),
+    path("tenders", AsyncTendersView.as_view(), name="tenders"),
+    path("tenders/export", AsyncTendersExportView.as_view(), name="tenders_export"),
+    path("tenders/<uuid:tenderId>/status", AsyncTendersStatusView.as_view(), name="tenders_status"),
+    path("tenders/my", AsyncUserTendersView.as_view(), name="tenders_my"),
+
+    path("bids/my", AsyncBidsMyView.as_view(), name="bids_my"),
+    path("bids/<uuid:tenderId>/list", AsyncBidsTendersListView.as_view(), name="bids_list"),
+    path("bids/<uuid:tenderId>/export", AsyncBidsExportView.as_view(), name="bids_export"),
+    path("bids/<uuid:bidId>/status", AsyncBidsStatusView.as_view(), name="bids_status"),
+] + urls.urlpatterns
@@ -0,0 +1,247 @@
+import uuid
+from typing import Any, Callable, Optional
+
+from asgiref.sync import sync_to_async
+from django.db.models import QuerySet
+from django.http import HttpRequest, HttpResponse
+from django.http.response import HttpResponseBase
+from django.views import View
+from rest_framework.exceptions import APIException, ValidationError
+from rest_framework.negotiation import DefaultContentNegotiation
+from rest_framework.renderers import BaseRenderer
+from rest_framework.request import Request
+from rest_framework.status import HTTP_400_BAD_REQUEST, HTTP_200_OK, HTTP_404_NOT_FOUND, HTTP_304_NOT_MODIFIED
+
+from .cache import tender_list_cache
+from .etags import conditional_result, entity_etag, etag_rows, serialize_page, unchanged_page_etag
+from .exports import EXPORT_RENDERERS, astream_rows, export_response
+from .identity import UNAUTHORIZED, aget_identity, tender_access_error, bid_access_error
+from .models import Tenders, Bids
+from .pagination import CustomPagination
+from .renderers import FastJSONRenderer
+from .routers import use_primary
+from .search import search_from_params
+from .serializers import FastSerializer, tender_serializer, bid_serializer
+from .views import tender_list_filter, TendersStatusAPIView, BidsStatusAPIView
+
+renderer = FastJSONRenderer()
+
+
+def json_response(data: Any, status: int = HTTP_200_OK, paginator: CustomPagination = None) -> HttpResponse:
+    """ Функция для ответа в том же формате, что и у APIView """
+    response = HttpResponse(renderer.render(data), status=status, content_type="application/json")
+    if paginator is not None and paginator.next_cursor is not None:
+        response[paginator.cursor_header] = paginator.next_cursor
+    return response
+
+
+def result_response(result: tuple) -> HttpResponse:
+    """ Функция для ответа по (статус, данные, заголовки) из conditional_result, работает как views.result_response """
+    status, data, headers = result
+    response = json_response(data, status=status)
+    for header, value in headers.items():
+        response[header] = value
+    return response
+
+
+def not_modified(etag: str) -> HttpResponse:
+    """ Функция для ответа 304 без тела, работает как views.not_modified """
+    response = HttpResponse(status=HTTP_304_NOT_MODIFIED)
+    response["ETag"] = etag
+    return response
+
+
+async def paginate(request: HttpRequest, queryset: QuerySet, serializer: FastSerializer) -> HttpResponse:
+    """ Функция для ответа страницей списка через асинхронный ORM с ETag, работает как views.conditional_page """
+    paginator = CustomPagination()
+    if_none_match = request.headers.get("If-None-Match")
+    try:
+        if if_none_match:
+            keys = await paginator.apaginate_queryset(etag_rows(queryset, serializer), Request(request))
+            etag = unchanged_page_etag(if_none_match, keys, paginator.next_cursor)
+            if etag is not None:
+                return not_modified(etag)
+        rows = await paginator.apaginate_queryset(serializer.rows(queryset), Request(request))
+    except ValidationError as e:
+        return json_response(e.detail, status=HTTP_400_BAD_REQUEST)
+    return result_response(conditional_result(None, *serialize_page(serializer, rows, paginator.next_cursor)))
+
+
+def export_renderer(request: HttpRequest) -> BaseRenderer:
+    """ Функция для выбора формата выгрузки по ?format= или Accept, как при согласовании формата в APIView """
+    renderer, _ = DefaultContentNegotiation().select_renderer(
+        Request(request), [renderer_class() for renderer_class in EXPORT_RENDERERS]
+    )
+    return renderer
+
+
+async def atender_access_denied(request: HttpRequest, tender: Tenders, username: str) -> Optional[HttpResponse]:
+    """ Функция для проверки прав пользователя на тендер, работает как tender_access_denied """
+    error = tender_access_error(await aget_identity(request, username), tender)
+    return None if error is None else json_response(error[1], status=error[0])
+
+
+async def abid_access_denied(request: HttpRequest, bid: Bids, username: str) -> Optional[HttpResponse]:
+    """ Функция для проверки прав пользователя на предложение, работает как bid_access_denied """
+    error = bid_access_error(await aget_identity(request, username), bid)
+    return None if error is None else json_response(error[1], status=error[0])
+
+
+def sync_handler(view_class: type) -> Callable:
+    """ Функция для выполнения метода синхронным APIView в потоке, например PUT у ресурса с async GET """
+    view = view_class.as_view()
+
+    def call(request: HttpRequest, *args, **kwargs) -> HttpResponse:
+        return view(request, *args, **kwargs).render()
+
+    async def handler(self, request: HttpRequest, *args, **kwargs) -> HttpResponse:
+        return await sync_to_async(call)(request, *args, **kwargs)
+    return handler
+
+
+class AsyncAPIView(View):
+    """ Базовый класс для async-представлений, CSRF не проверяется, как и в APIView """
+
+    @classmethod
+    def as_view(cls, **initkwargs) -> Callable:
+        view = super().as_view(**initkwargs)
+        view.csrf_exempt = True
+        return view
+
+
+class AsyncPingView(AsyncAPIView):
+    """ Класс для проверки доступности сервера """
+
+    async def get(self, request: HttpRequest) -> HttpResponse:
+        return json_response("ok")
+
+
+class AsyncTendersView(AsyncAPIView):
+    """ Класс для получения списка тендеров """
+
+    async def get(self, request: HttpRequest) -> HttpResponse:
+        filterset = tender_list_filter(request.GET)
+        if not filterset.is_valid():
+            return json_response({"reason": "Неверный формат запроса или его параметры."},
+                                 status=HTTP_400_BAD_REQUEST)
+        key = await tender_list_cache.akey(request.GET)
+        page = await tender_list_cache.aget(key)
+        if page is None:
+            paginator = CustomPagination()
+            try:
+                with use_primary():
+                    rows = await paginator.apaginate_queryset(tender_serializer.rows(filterset.qs), Request(request))
+            except ValidationError as e:
+                return json_response(e.detail, status=HTTP_400_BAD_REQUEST)
+            page = serialize_page(tender_serializer, rows, paginator.next_cursor)
+            await tender_list_cache.aset(key, page)
+        return result_response(conditional_result(request.headers.get("If-None-Match"), *page))
+
+
+class AsyncUserTendersView(AsyncAPIView):
+    """ Класс для получения списка тендеров текущего пользователя """
+
+    async def get(self, request: HttpRequest) -> HttpResponse:
+        user = request.GET.get("username")
+        if await aget_identity(request, user) is None:
+            return json_response(UNAUTHORIZED[1], status=UNAUTHORIZED[0])
+        queryset = Tenders.objects.filter(creatorUsername=user).order_by("tenderName", "tenderId")
+        return await paginate(request, queryset, tender_serializer)
+
+
+class AsyncTendersStatusView(AsyncAPIView):
+    """ Класс для получения статуса тендера, изменение выполняет TendersStatusAPIView """
+
+    async def get(self, request: HttpRequest, tenderId: uuid.UUID) -> HttpResponse:
+        try:
+            tender = await Tenders.objects.only("tenderId", "tenderStatus", "tenderVersion", "creatorUsername",
+                                                "organizationId").aget(tenderId=tenderId)
+        except Tenders.DoesNotExist:
+            return json_response({"reason": "Тендер не найден"}, status=HTTP_404_NOT_FOUND)
+        denied = await atender_access_denied(request, tender, request.GET.get("username"))
+        if denied is not None:
+            return denied
+        return result_response(conditional_result(request.headers.get("If-None-Match"), tender.tenderStatus, None,
+                                                  entity_etag(tender.tenderId, tender.tenderVersion)))
+
+    put = sync_handler(TendersStatusAPIView)
+
+
+class AsyncBidsMyView(AsyncAPIView):
+    """ Класс для получения списка предложений пользователя """
+
+    async def get(self, request: HttpRequest) -> HttpResponse:
+        identity = await aget_identity(request, request.GET.get("username"))
+        if identity is None:
+            return json_response(UNAUTHORIZED[1], status=UNAUTHORIZED[0])
+        queryset = Bids.objects.filter(bidAuthorId_id=identity.employee_id).order_by("bidName", "bidId")
+        return await paginate(request, search_from_params(queryset, request.GET), bid_serializer)
+
+
+class AsyncBidsTendersListView(AsyncAPIView):
+    """ Класс для получения списка предложений для тендера """
+
+    async def get(self, request: HttpRequest, tenderId: uuid.UUID) -> HttpResponse:
+        try:
+            tender = await Tenders.objects.only("tenderId", "creatorUsername", "organizationId") \
+                .aget(tenderId=tenderId)
+        except Tenders.DoesNotExist:
+            return json_response({"reason": "Тендер не найден"}, status=HTTP_404_NOT_FOUND)
+        denied = await atender_access_denied(request, tender, request.GET.get("username"))
+        if denied is not None:
+            return denied
+        queryset = Bids.objects.filter(tenderId=tenderId).order_by("bidName", "bidId")
+        return await paginate(request, queryset, bid_serializer)
+
+
+class AsyncBidsStatusView(AsyncAPIView):
+    """ Класс для получения статуса предложения, изменение выполняет BidsStatusAPIView """
+
+    async def get(self, request: HttpRequest, bidId: uuid.UUID) -> HttpResponse:
+        try:
+            bid = await Bids.objects.only("bidId", "bidStatus", "bidVersion", "bidAuthorId", "organizationId") \
+                .aget(bidId=bidId)
+        except Bids.DoesNotExist:
+            return json_response({"reason": "Предложение не найдено"}, status=HTTP_404_NOT_FOUND)
+        denied = await abid_access_denied(request, bid, request.GET.get("username"))
+        if denied is not None:
+            return denied
+        return result_response(conditional_result(request.headers.get("If-None-Match"), bid.bidStatus, None,
+                                                  entity_etag(bid.bidId, bid.bidVersion)))
+
+    put = sync_handler(BidsStatusAPIView)
+
+
+class AsyncTendersExportView(AsyncAPIView):
+    """ Класс для потоковой выгрузки публичного списка тендеров, работает как TendersExportAPIView """
+
+    async def get(self, request: HttpRequest) -> HttpResponseBase:
+        try:
+            renderer = export_renderer(request)
+        except APIException as e:
+            return json_response({"reason": str(e.detail)}, status=e.status_code)
+        filterset = tender_list_filter(request.GET)
+        if not filterset.is_valid():
+            return json_response({"reason": "Неверный формат запроса или его параметры."},
+                                 status=HTTP_400_BAD_REQUEST)
+        return export_response(astream_rows(filterset.qs, tender_serializer, renderer), renderer, "tenders")
+
+
+class AsyncBidsExportView(AsyncAPIView):
+    """ Класс для потоковой выгрузки предложений по тендеру, работает как BidsExportAPIView """
+
+    async def get(self, request: HttpRequest, tenderId: uuid.UUID) -> HttpResponseBase:
+        try:
+            renderer = export_renderer(request)
+        except APIException as e:
+            return json_response({"reason": str(e.detail)}, status=e.status_code)
+        try:
+            tender = await Tenders.objects.only("tenderId", "creatorUsername", "organizationId") \
+                .aget(tenderId=tenderId)
+        except Tenders.DoesNotExist:
+            return json_response({"reason": "Тендер не найден"}, status=HTTP_404_NOT_FOUND)
+        denied = await atender_access_denied(request, tender, request.GET.get("username"))
+        if denied is not None:
+            return denied
+        queryset = Bids.objects.filter(tenderId=tenderId).order_by("bidName", "bidId")
+        return export_response(astream_rows(queryset, bid_serializer, renderer), renderer, f"bids-{tenderId}")
@@ -0,0 +1,510 @@
+import asyncio
+import http.client
+import json
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+from unittest import mock
+from urllib.parse import urlencode, urlsplit
+
+from django.conf import settings
+from django.core.management.base import CommandError
+from django.db import close_old_connections, connection, transaction
+from django.http import QueryDict
+from django.test import AsyncClient, Client
+from django.test.utils import override_settings
+from rest_framework.renderers import JSONRenderer
+from rest_framework.views import APIView
+
+from .cache import tender_list_cache
+from .db_metrics import connection_stats
+from . import urls
+from .models import Bids, Employee, Organization, OrganizationResponsible, Reviews, Tenders
+from .renderers import FastJSONRenderer
+from .serializers import TenderSerializer, tender_serializer
+from .synthetic import SyntheticDataset
+
+SUITES = {}
+
+
+def suite(name: str, rollback: bool = True) -> Callable:
+    """
+    Декоратор для регистрации набора замеров под именем для команды benchmark.
+    Наборы с rollback=False работают из нескольких потоков, поэтому сами удаляют созданные данные
+    """
+    def register(func: Callable) -> Callable:
+        func.rollback = rollback
+        SUITES[name] = func
+        return func
+    return register
+
+
+def run_suite(name: str, **options) -> dict:
+    """
+    Функция для запуска набора замеров в транзакции, которая откатывается после замера.
+    Тестовые клиенты отправляют запросы с хостом testserver, поэтому он временно разрешается
+    """
+    with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"]):
+        if not SUITES[name].rollback:
+            return SUITES[name](**options)
+        with transaction.atomic():
+            result = SUITES[name](**options)
+            transaction.set_rollback(True)
+        return result
+
+
+def make_client() -> Client:
+    """ Функция для создания клиента, который вызывает представления без сетевого сервера """
+    return Client()
+
+
+def make_async_client() -> AsyncClient:
+    """ Функция для создания клиента, который вызывает ASGI-обработчик без сетевого сервера """
+    return AsyncClient()
+
+
+def make_responsible(username: str = "benchmark") -> Employee:
+    """ Функция для создания пользователя, ответственного за новую организацию """
+    organization = Organization.objects.create(name="Организация для замеров", type="LLC")
+    employee = Employee.objects.create(username=username, first_name="Имя", last_name="Фамилия")
+    OrganizationResponsible.objects.create(user_id=employee, organization_id=organization)
+    employee.organization = organization
+    return employee
+
+
+def measure(func: Callable) -> float:
+    """ Функция для замера времени выполнения в секундах """
+    started = time.perf_counter()
+    func()
+    return time.perf_counter() - started
+
+
+def percentiles(durations: list) -> dict:
+    """ Функция для расчета p50, p95 и p99 задержки в миллисекундах """
+    cuts = statistics.quantiles(durations, n=100, method="inclusive")
+    return {"p50_ms": round(cuts[49] * 1000, 3), "p95_ms": round(cuts[94] * 1000, 3),
+            "p99_ms": round(cuts[98] * 1000, 3)}
+
+
+def find_regressions(baseline: dict, result: dict, threshold: float, path: str = "") -> list:
+    """
+    Функция для сравнения результата с сохраненным результатом другого коммита.
+    Возвращает задержки (ключи *_ms), выросшие больше чем на threshold процентов
+    """
+    regressions = []
+    for key, value in result.items():
+        previous = baseline.get(key) if isinstance(baseline, dict) else None
+        name = f"{path}.{key}" if path else key
+        if isinstance(value, dict):
+            regressions += find_regressions(previous or {}, value, threshold, name)
+        elif key.endswith("_ms") and isinstance(previous, (int, float)) and previous > 0:
+            if value > previous * (1 + threshold / 100):
+                regressions.append(f"{name}: {previous} -> {value} мс (+{(value / previous - 1) * 100:.0f}%)")
+    return regressions
+
+
+def compare(items: int, single: float, bulk: float) -> dict:
+    """ Функция для сравнения пропускной способности поштучного и пакетного создания """
+    return {
+        "items": items,
+        "single_per_second": round(items / single, 1),
+        "bulk_per_second": round(items / bulk, 1),
+        "speedup": round(single / bulk, 2),
+    }
+
+
+@suite("bulk")
+def bench_bulk(items: int = 500, batch: int = 100, **options) -> dict:
+    """ Функция для сравнения /tenders/new и /bids/new с пакетными /tenders/bulk и /bids/bulk """
+    client = make_client()
+    employee = make_responsible()
+    tender_items = [{
+        "name": f"Тендер {i}",
+        "description": "Описание",
+        "serviceType": "Delivery",
+        "organizationId": str(employee.organization.pk),
+        "creatorUsername": employee.username,
+    } for i in range(items)]
+
+    def post_each(url: str, payloads: list) -> None:
+        for payload in payloads:
+            client.post(url, payload, content_type="application/json")
+
+    def post_batches(url: str, payloads: list) -> None:
+        for start in range(0, len(payloads), batch):
+            client.post(url, payloads[start:start + batch], content_type="application/json")
+
+    tenders_single = measure(lambda: post_each("/api/tenders/new", tender_items))
+    tenders_bulk = measure(lambda: post_batches("/api/tenders/bulk", tender_items))
+
+    tender_id = str(Tenders.objects.filter(creatorUsername=employee.username).values_list("pk", flat=True)[0])
+    bid_items = [{
+        "name": f"Предложение {i}",
+        "description": "Описание",
+        "tenderId": tender_id,
+        "authorType": "User",
+        "authorId": str(employee.pk),
+    } for i in range(items)]
+    bids_single = measure(lambda: post_each("/api/bids/new", bid_items))
+    bids_bulk = measure(lambda: post_batches("/api/bids/bulk", bid_items))
+
+    return {
+        "tenders": compare(items, tenders_single, tenders_bulk),
+        "bids": compare(items, bids_single, bids_bulk),
+    }
+
+
+@suite("serializers")
+def bench_serializers(items: int = 1000, repeat: int = 20, **options) -> dict:
+    """ Функция для сравнения FastSerializer с DRF ModelSerializer на странице из items тендеров """
+    employee = make_responsible()
+    Tenders.objects.bulk_create([
+        Tenders(tenderName=f"Тендер {i}", tenderDescription="Описание", tenderServiceType="Delivery",
+                tenderStatus="Published", organizationId=employee.organization, creatorUsername=employee.username)
+        for i in range(items)
+    ])
+    queryset = Tenders.objects.filter(creatorUsername=employee.username).order_by("tenderName", "tenderId")
+    instances = list(queryset)
+    rows = list(tender_serializer.rows(queryset))
+
+    model_serializer = measure(lambda: [TenderSerializer(instances, many=True).data for _ in range(repeat)])
+    fast_serializer = measure(lambda: [tender_serializer.serialize_rows(rows) for _ in range(repeat)])
+    return {
+        "rows": items,
+        "model_serializer_rows_per_second": round(items * repeat / model_serializer),
+        "fast_serializer_rows_per_second": round(items * repeat / fast_serializer),
+        "speedup": round(model_serializer / fast_serializer, 2),
+    }
+
+
+@suite("renderers")
+def bench_renderers(items: int = 1000, batch: int = 50, repeat: int = 200, **options) -> dict:
+    """ Функция для сравнения задержки страниц списков с JSONRenderer и FastJSONRenderer """
+    client = make_client()
+    employee = make_responsible()
+    tenders = Tenders.objects.bulk_create([
+        Tenders(tenderName=f"Тендер {i}", tenderDescription="Описание", tenderServiceType="Delivery",
+                tenderStatus="Published", organizationId=employee.organization, creatorUsername=employee.username)
+        for i in range(items)
+    ])
+    Bids.objects.bulk_create([
+        Bids(bidName=f"Предложение {i}", bidDescription="Описание", bidStatus="Published", tenderId=tenders[0],
+             organizationId=employee.organization, bidAuthorType="User", bidAuthorId=employee)
+        for i in range(items)
+    ])
+    pages = {
+        "tenders": f"/api/tenders?limit={batch}",
+        "bids": f"/api/bids/{tenders[0].pk}/list?username={employee.username}&limit={batch}",
+    }
+
+    result = {}
+    for name, url in pages.items():
+        result[name] = {}
+        for renderer in (JSONRenderer, FastJSONRenderer):
+            with mock.patch.object(APIView, "renderer_classes", [renderer]):
+                client.get(url)
+                durations = [measure(lambda: client.get(url)) for _ in range(repeat)]
+            result[name][renderer.__name__] = percentiles(durations)
+    return result
+
+
+def load_wsgi(urls: list, concurrency: int, threads: int) -> tuple:
+    """
+    Функция для нагрузки WSGI-обработчика: concurrency клиентов шлют запросы по очереди,
+    а обслуживают их не больше threads потоков воркера. Задержка включает ожидание свободного потока
+    """
+    client = make_client()
+    workers = threading.BoundedSemaphore(threads)
+
+    def run_client(chunk: list) -> list:
+        durations = []
+        for url in chunk:
+            started = time.perf_counter()
+            with workers:
+                client.get(url)
+            durations.append(time.perf_counter() - started)
+        connection.close()
+        return durations
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        started = time.perf_counter()
+        chunks = list(executor.map(run_client, [urls[i::concurrency] for i in range(concurrency)]))
+        return time.perf_counter() - started, [duration for chunk in chunks for duration in chunk]
+
+
+async def load_asgi(urls: list, concurrency: int) -> tuple:
+    """ Функция для нагрузки ASGI-обработчика: concurrency клиентов шлют запросы по очереди в одном цикле событий """
+    client = make_async_client()
+
+    async def run_client(chunk: list) -> list:
+        durations = []
+        for url in chunk:
+            started = time.perf_counter()
+            await client.get(url)
+            durations.append(time.perf_counter() - started)
+        return durations
+
+    started = time.perf_counter()
+    chunks = await asyncio.gather(*(run_client(urls[i::concurrency]) for i in range(concurrency)))
+    return time.perf_counter() - started, [duration for chunk in chunks for duration in chunk]
+
+
+@suite("asgi", rollback=False)
+def bench_asgi(items: int = 500, batch: int = 50, threads: int = 8, **options) -> dict:
+    """
+    Функция для сравнения масштабирования по числу одновременных клиентов под WSGI и ASGI.
+    WSGI моделирует воркер с пулом из threads потоков, ASGI обслуживает все запросы одним циклом событий
+    """
+    employee = make_responsible("benchmark-asgi")
+    try:
+        tenders = Tenders.objects.bulk_create([
+            Tenders(tenderName=f"Тендер {i}", tenderDescription="Описание", tenderServiceType="Delivery",
+                    tenderStatus="Published", organizationId=employee.organization, creatorUsername=employee.username)
+            for i in range(batch * 2)
+        ])
+        Bids.objects.bulk_create([
+            Bids(bidName=f"Предложение {i}", bidDescription="Описание", bidStatus="Published", tenderId=tenders[0],
+                 organizationId=employee.organization, bidAuthorType="User", bidAuthorId=employee)
+            for i in range(batch * 2)
+        ])
+        pages = [
+            f"/api/tenders?limit={batch}",
+            f"/api/tenders/my?username={employee.username}&limit={batch}",
+            f"/api/bids/{tenders[0].pk}/list?username={employee.username}&limit={batch}",
+            f"/api/tenders/{tenders[0].pk}/status?username={employee.username}",
+        ]
+        urls = [pages[i % len(pages)] for i in range(items)]
+
+        result = {}
+        for concurrency in (1, 16, 128):
+            elapsed, durations = load_wsgi(urls, concurrency, threads)
+            with override_settings(ROOT_URLCONF="avito.asgi_urls"):
+                async_elapsed, async_durations = asyncio.run(load_asgi(urls, concurrency))
+            result[f"concurrency_{concurrency}"] = {
+                "wsgi": {"requests_per_second": round(items / elapsed, 1), **percentiles(durations)},
+                "asgi": {"requests_per_second": round(items / async_elapsed, 1), **percentiles(async_durations)},
+            }
+        return result
+    finally:
+        employee.organization.delete()
+        employee.delete()
+
+
+@suite("connections", rollback=False)
+def bench_connections(items: int = 500, **options) -> dict:
+    """
+    Функция для сравнения задержки запросов с новым соединением на каждый запрос (CONN_MAX_AGE=0)
+    и с постоянными соединениями. Тестовый клиент не закрывает соединения сам,
+    поэтому после запроса, как и обработчик Django, вызывается close_old_connections
+    """
+    employee = make_responsible("benchmark-connections")
+    client = make_client()
+    url = f"/api/tenders/my?username={employee.username}&limit=5"
+    settings_dict = connection.settings_dict
+    conn_max_age = settings_dict["CONN_MAX_AGE"]
+    result = {}
+    try:
+        for max_age in (0, 60):
+            settings_dict["CONN_MAX_AGE"] = max_age
+            connection.close()
+            opened = connection_stats.opened
+            durations = []
+            for _ in range(items):
+                started = time.perf_counter()
+                client.get(url)
+                close_old_connections()
+                durations.append(time.perf_counter() - started)
+            result[f"conn_max_age_{max_age}"] = {
+                "connections_opened": connection_stats.opened - opened,
+                **percentiles(durations),
+            }
+    finally:
+        settings_dict["CONN_MAX_AGE"] = conn_max_age
+        employee.organization.delete()
+        employee.delete()
+    return result
+
+
+@suite("list_cache")
+def bench_list_cache(items: int = 1000, batch: int = 50, repeat: int = 200, **options) -> dict:
+    """ Функция для сравнения задержки страниц публичного списка тендеров без кэша и из кэша """
+    client = make_client()
+    employee = make_responsible()
+    Tenders.objects.bulk_create([
+        Tenders(tenderName=f"Тендер {i}", tenderDescription="Описание", tenderServiceType="Delivery",
+                tenderStatus="Published", organizationId=employee.organization, creatorUsername=employee.username)
+        for i in range(items)
+    ])
+    urls = [f"/api/tenders?limit={batch}&offset={offset}" for offset in range(0, items, batch)]
+
+    misses = []
+    for i in range(repeat):
+        tender_list_cache.cache.delete(tender_list_cache.key(QueryDict(urls[i % len(urls)].split("?")[1])))
+        misses.append(measure(lambda: client.get(urls[i % len(urls)])))
+    tender_list_cache.clear_stats()
+    hits = [measure(lambda: client.get(urls[i % len(urls)])) for i in range(repeat)]
+    return {
+        "miss": percentiles(misses),
+        "hit": percentiles(hits),
+        "stats": tender_list_cache.stats(),
+    }
+
+
+class HttpClient:
+    """ Класс клиента для замеров на запущенном сервере, держит одно keep-alive соединение на поток """
+
+    def __init__(self, base_url: str) -> None:
+        parts = urlsplit(base_url)
+        connection_class = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        self.connection = connection_class(parts.netloc, timeout=30)
+        self.prefix = parts.path.rstrip("/")
+
+    def call(self, method: str, path: str, data=None) -> int:
+        body = json.dumps(data) if data is not None else None
+        self.connection.request(method.upper(), self.prefix + path, body, {"Content-Type": "application/json"})
+        response = self.connection.getresponse()
+        response.read()
+        return response.status
+
+
+class InProcessClient:
+    """ Класс клиента для замеров без сетевого сервера с тем же интерфейсом, что у HttpClient """
+
+    def __init__(self) -> None:
+        self.client = make_client()
+
+    def call(self, method: str, path: str, data=None) -> int:
+        body = json.dumps(data) if data is not None else ""
+        response = self.client.generic(method.upper(), path, body, content_type="application/json")
+        if response.streaming:
+            b"".join(response.streaming_content)
+        return response.status_code
+
+
+def endpoint_fixtures() -> Optional[dict]:
+    """
+    Функция для выбора объектов из уже загруженных данных, на которых вызываются маршруты.
+    Нужен отзыв на опубликованное предложение без решения по опубликованному тендеру организации,
+    у которой не меньше двух ответственных: тогда повторные решения одного ответственного не закрывают тендер
+    """
+    reviews = (
+        Reviews.objects.select_related("bidId__tenderId", "authorId")
+        .filter(bidId__bidStatus="Published", bidId__bidDecision="", bidId__tenderId__tenderStatus="Published",
+                bidId__tenderId__organizationId__responsible_count__gte=2)
+        .order_by()[:1]
+    )
+    review = next(iter(reviews), None)
+    if review is None:
+        return None
+    bid, tender = review.bidId, review.bidId.tenderId
+    responsible = (OrganizationResponsible.objects.filter(organization_id=tender.organizationId_id)
+                   .values_list("user_id__username", flat=True).order_by()[:1].get())
+    return {"tender": tender, "bid": bid, "author": review.authorId, "responsible": responsible}
+
+
+def endpoint_calls(fixtures: dict, batch: int) -> dict:
+    """ Функция для описания вызова каждого маршрута tenders/urls.py: (метод, путь с параметрами, тело) """
+    tender, bid, author = fixtures["tender"], fixtures["bid"], fixtures["author"]
+    responsible = urlencode({"username": fixtures["responsible"]})
+    by_author = urlencode({"username": author.username})
+    page = f"limit={batch}"
+    tender_item = {"name": "Тендер", "description": "Описание", "serviceType": "Delivery",
+                   "organizationId": str(tender.organizationId_id), "creatorUsername": fixtures["responsible"]}
+    bid_item = {"name": "Предложение", "description": "Описание", "tenderId": str(tender.pk),
+                "authorType": "User", "authorId": str(author.pk)}
+    reviews = urlencode({"authorUsername": author.username, "requesterUsername": fixtures["responsible"]})
+    decision, feedback = urlencode({"decision": "Approved"}), urlencode({"bidFeedback": "Отзыв"})
+    return {
+        "ping": ("get", "/api/ping", None),
+        "metrics_db": ("get", "/api/metrics/db", None),
+        "metrics_cache": ("get", "/api/metrics/cache", None),
+        "tenders": ("get", f"/api/tenders?{page}", None),
+        "tenders_export": ("get", "/api/tenders/export", None),
+        "tenders_new": ("post", "/api/tenders/new", tender_item),
+        "tenders_bulk": ("post", "/api/tenders/bulk", [tender_item] * batch),
+        "tenders_status": ("get", f"/api/tenders/{tender.pk}/status?{responsible}", None),
+        "tenders_edit": ("patch", f"/api/tenders/{tender.pk}/edit?{responsible}", {"description": "Описание"}),
+        "tenders_rollback": ("put", f"/api/tenders/{tender.pk}/rollback/1?{responsible}", None),
+        "tenders_history": ("get", f"/api/tenders/{tender.pk}/history?{responsible}&{page}", None),
+        "tenders_my": ("get", f"/api/tenders/my?{responsible}&{page}", None),
+        "bids_new": ("post", "/api/bids/new", bid_item),
+        "bids_bulk": ("post", "/api/bids/bulk", [bid_item] * batch),
+        "bids_my": ("get", f"/api/bids/my?{by_author}&{page}", None),
+        "bids_list": ("get", f"/api/bids/{tender.pk}/list?{responsible}&{page}", None),
+        "bids_export": ("get", f"/api/bids/{tender.pk}/export?{responsible}", None),
+        "bids_status": ("get", f"/api/bids/{bid.pk}/status?{by_author}", None),
+        "bids_edit": ("patch", f"/api/bids/{bid.pk}/edit?{by_author}", {"description": "Описание"}),
+        "bids_decision": ("put", f"/api/bids/{bid.pk}/submit_decision?{responsible}&{decision}", None),
+        "bids_feedback": ("put", f"/api/bids/{bid.pk}/feedback?{responsible}&{feedback}", None),
+        "bids_rollback": ("put", f"/api/bids/{bid.pk}/rollback/1?{by_author}", None),
+        "bids_history": ("get", f"/api/bids/{bid.pk}/history?{by_author}&{page}", None),
+        "bids_reviews": ("get", f"/api/bids/{tender.pk}/reviews?{reviews}&{page}", None),
+    }
+
+
+def load_endpoint(make: Callable, call: tuple, items: int, concurrency: int) -> dict:
+    """ Функция для замера одного маршрута: concurrency клиентов по очереди отправляют items запросов """
+    method, path, data = call
+
+    def run_client(count: int) -> tuple:
+        client = make()
+        durations, errors = [], 0
+        for _ in range(count):
+            started = time.perf_counter()
+            status = client.call(method, path, data)
+            durations.append(time.perf_counter() - started)
+            errors += status >= 400
+        return durations, errors
+
+    counts = [items // concurrency + (i < items % concurrency) for i in range(concurrency)]
+    started = time.perf_counter()
+    if concurrency == 1:
+        chunks = [run_client(items)]
+    else:
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            chunks = list(executor.map(run_client, counts))
+    elapsed = time.perf_counter() - started
+    durations = [duration for chunk, _ in chunks for duration in chunk]
+    return {
+        "method": method.upper(),
+        "requests": items,
+        "errors": sum(errors for _, errors in chunks),
+        "requests_per_second": round(items / elapsed, 1),
+        **percentiles(durations),
+    }
+
+
+@suite("endpoints")
+def bench_endpoints(items: int = 200, batch: int = 50, base_url: Optional[str] = None, concurrency: int = 1,
+                    **options) -> dict:
+    """
+    Функция для замера пропускной способности и задержки каждого маршрута tenders/urls.py.
+    Без base_url маршруты вызываются в процессе одним клиентом, изменения откатываются вместе с транзакцией замера,
+    а если данных нет, создается небольшой набор SyntheticDataset. С base_url запросы идут на запущенный сервер
+    из concurrency потоков, данные должны быть загружены командой generate_data, а изменения сохраняются.
+    Одновременные изменения одного объекта частично завершаются 409 и учитываются в errors
+    """
+    fixtures = endpoint_fixtures()
+    if fixtures is None:
+        if base_url:
+            raise CommandError("В базе нет данных для замеров, загрузите их командой generate_data")
+        size = max(items, 100)
+        SyntheticDataset(organizations=10, employees=100, responsibles=50, tenders=size, bids=size * 5,
+                         reviews=size, prefix="benchmark").generate()
+        fixtures = endpoint_fixtures()
+    calls = endpoint_calls(fixtures, batch)
+    missing = {pattern.name for pattern in urls.urlpatterns if pattern.name} - set(calls)
+    if missing:
+        raise CommandError(f"Нет вызова для маршрутов: {', '.join(sorted(missing))}")
+
+    if base_url:
+        make, concurrency = (lambda: HttpClient(base_url)), max(concurrency, 1)
+    else:
+        make, concurrency = InProcessClient, 1
+    return {
+        "rows": {model._meta.db_table: model.objects.count() for model in (Tenders, Bids, Reviews)},
+        "concurrency": concurrency,
+        "routes": {name: load_endpoint(make, call, items, concurrency) for name, call in calls.items()},
+    }
@@ -0,0 +1,177 @@
+from collections import defaultdict
+from typing import Optional
+
+from django.db import transaction
+
+from .cache import tender_list_cache
+from .identity import parse_uuid
+from .models import Tenders, Employee, Bids, TenderVersion, BidVersion
+from .serializers import tender_serializer, bid_serializer
+
+BULK_MAX_ITEMS = 1000
+
+TENDER_SERVICE_TYPES = {choice for choice, _ in Tenders.TENDER_SERVICE_TYPE}
+BID_AUTHOR_TYPES = {choice for choice, _ in Bids.BID_AUTHOR_TYPE}
+
+
+def _error(index: int, status: int, reason: str) -> dict:
+    """ Функция для формирования результата элемента, который не был создан """
+    return {"index": index, "status": status, "reason": reason}
+
+
+def _text_error(item: dict, field: str, max_length: int) -> Optional[str]:
+    """ Функция для проверки строкового поля элемента """
+    value = item.get(field)
+    if not isinstance(value, str) or not value or len(value) > max_length:
+        return f"Поле {field} должно быть непустой строкой до {max_length} символов"
+    return None
+
+
+def _organizations_by_username(usernames: set) -> dict:
+    """ Функция для получения организаций пользователей по username одним IN-запросом """
+    organizations = defaultdict(set)
+    rows = Employee.objects.filter(username__in=usernames).values_list(
+        "username", "organizationresponsible__organization_id"
+    )
+    for username, organization_id in rows:
+        organizations[username]
+        if organization_id is not None:
+            organizations[username].add(organization_id)
+    return organizations
+
+
+def _organizations_by_employee(employee_ids: set) -> dict:
+    """ Функция для получения организаций пользователей по id одним IN-запросом """
+    organizations = defaultdict(set)
+    rows = Employee.objects.filter(id__in=employee_ids).values_list(
+        "id", "organizationresponsible__organization_id"
+    )
+    for employee_id, organization_id in rows:
+        organizations[employee_id]
+        if organization_id is not None:
+            organizations[employee_id].add(organization_id)
+    return organizations
+
+
+def bulk_create_tenders(items: list) -> list:
+    """
+    Функция для создания тендеров пачкой.
+    Пользователи проверяются одним IN-запросом, тендеры и их версии вставляются двумя bulk_create
+    в одной транзакции. Возвращает результат для каждого элемента в исходном порядке
+    """
+    results = [None] * len(items)
+    prepared = []
+    for index, item in enumerate(items):
+        if not isinstance(item, dict):
+            results[index] = _error(index, 400, "Элемент должен быть объектом")
+            continue
+        reason = (_text_error(item, "name", 100) or _text_error(item, "description", 500)
+                  or _text_error(item, "creatorUsername", 50))
+        if reason is None and item.get("serviceType") not in TENDER_SERVICE_TYPES:
+            reason = "Некорректный serviceType"
+        organization_id = parse_uuid(item.get("organizationId"))
+        if reason is None and organization_id is None:
+            reason = "Некорректный organizationId"
+        if reason is not None:
+            results[index] = _error(index, 400, reason)
+            continue
+        prepared.append((index, item, organization_id))
+
+    organizations = _organizations_by_username({item["creatorUsername"] for _, item, _ in prepared})
+    tenders = []
+    for index, item, organization_id in prepared:
+        if item["creatorUsername"] not in organizations:
+            results[index] = _error(index, 401, "Пользователь не существует или некорректен")
+        elif organization_id not in organizations[item["creatorUsername"]]:
+            results[index] = _error(index, 403, "Недостаточно прав для выполнения действия")
+        else:
+            tenders.append((index, Tenders(
+                tenderName=item["name"],
+                tenderDescription=item["description"],
+                tenderServiceType=item["serviceType"],
+                tenderStatus="Created",
+                organizationId_id=organization_id,
+                creatorUsername=item["creatorUsername"],
+            )))
+
+    with transaction.atomic():
+        Tenders.objects.bulk_create([tender for _, tender in tenders])
+        tender_list_cache.bump_generation()
+        TenderVersion.objects.bulk_create([
+            TenderVersion(tenderId_id=tender.tenderId, tenderName=tender.tenderName,
+                          tenderDescription=tender.tenderDescription, tenderServiceType=tender.tenderServiceType,
+                          tenderStatus=tender.tenderStatus, tenderVersion=tender.tenderVersion)
+            for _, tender in tenders
+        ])
+
+    for index, tender in tenders:
+        results[index] = {
+            "index": index,
+            "status": 200,
+            "tender": tender_serializer.serialize(tender),
+        }
+    return results
+
+
+def bulk_create_bids(items: list) -> list:
+    """
+    Функция для создания предложений пачкой, работает как bulk_create_tenders.
+    Авторы и тендеры проверяются одним IN-запросом каждый
+    """
+    results = [None] * len(items)
+    prepared = []
+    for index, item in enumerate(items):
+        if not isinstance(item, dict):
+            results[index] = _error(index, 400, "Элемент должен быть объектом")
+            continue
+        reason = _text_error(item, "name", 100) or _text_error(item, "description", 500)
+        if reason is None and item.get("authorType") not in BID_AUTHOR_TYPES:
+            reason = "Некорректный authorType"
+        tender_id = parse_uuid(item.get("tenderId"))
+        author_id = parse_uuid(item.get("authorId"))
+        if reason is None and (tender_id is None or author_id is None):
+            reason = "Некорректный tenderId или authorId"
+        if reason is not None:
+            results[index] = _error(index, 400, reason)
+            continue
+        prepared.append((index, item, tender_id, author_id))
+
+    organizations = _organizations_by_employee({author_id for _, _, _, author_id in prepared})
+    tender_ids = set(
+        Tenders.objects.filter(tenderId__in={tender_id for _, _, tender_id, _ in prepared})
+        .values_list("tenderId", flat=True)
+    )
+    bids = []
+    for index, item, tender_id, author_id in prepared:
+        if author_id not in organizations:
+            results[index] = _error(index, 401, "Пользователь не существует или некорректен")
+        elif not organizations[author_id]:
+            results[index] = _error(index, 403, "Недостаточно прав для выполнения действия")
+        elif tender_id not in tender_ids:
+            results[index] = _error(index, 404, "Тендер не найден")
+        else:
+            bids.append((index, Bids(
+                bidName=item["name"],
+                bidDescription=item["description"],
+                bidStatus="Created",
+                tenderId_id=tender_id,
+                organizationId_id=next(iter(organizations[author_id])),
+                bidAuthorType=item["authorType"],
+                bidAuthorId_id=author_id,
+            )))
+
+    with transaction.atomic():
+        Bids.objects.bulk_create([bid for _, bid in bids])
+        BidVersion.objects.bulk_create([
+            BidVersion(bidId_id=bid.bidId, bidName=bid.bidName, bidDescription=bid.bidDescription,
+                       bidStatus=bid.bidStatus, bidDecision=bid.bidDecision, bidVersion=bid.bidVersion)
+            for _, bid in bids
+        ])
+
+    for index, bid in bids:
+        results[index] = {
+            "index": index,
+            "status": 200,
+            "bid": bid_serializer.serialize(bid),
+        }
+    return results
@@ -0,0 +1,220 @@
+import hashlib
+import time
+import uuid
+from collections import OrderedDict
+from threading import Lock
+from typing import TYPE_CHECKING, Callable, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.http import QueryDict
+
+if TYPE_CHECKING:
+    from .identity import Identity
+
+
+class IdentityCache:
+    """
+    Класс для кэширования пользователей и их организаций внутри процесса.
+    Записи вытесняются по времени жизни (TTL) и по размеру (LRU), доступны по username и по id.
+    Сбрасываются сигналами при изменении Employee и OrganizationResponsible,
+    а в других процессах устаревают не позже чем через TTL
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0,
+                 timer: Callable[[], float] = time.monotonic) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._timer = timer
+        self._lock = Lock()
+        self._entries: OrderedDict = OrderedDict()
+        self._usernames_by_id: dict = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, username: str) -> Optional["Identity"]:
+        """ Функция для получения пользователя по username """
+        with self._lock:
+            return self._get(username)
+
+    def get_by_id(self, employee_id: uuid.UUID) -> Optional["Identity"]:
+        """ Функция для получения пользователя по id """
+        with self._lock:
+            username = self._usernames_by_id.get(employee_id)
+            if username is None:
+                self.misses += 1
+                return None
+            return self._get(username)
+
+    def _get(self, username: str) -> Optional["Identity"]:
+        entry = self._entries.get(username)
+        if entry is None:
+            self.misses += 1
+            return None
+        identity, expires_at = entry
+        if expires_at <= self._timer():
+            self._remove(username)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(username)
+        self.hits += 1
+        return identity
+
+    def set(self, identity: "Identity") -> None:
+        """ Функция для сохранения пользователя в кэше """
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._remove(identity.username)
+            self._remove_id(identity.employee_id)
+            self._entries[identity.username] = (identity, self._timer() + self.ttl)
+            self._usernames_by_id[identity.employee_id] = identity.username
+            while len(self._entries) > self.maxsize:
+                _, (evicted, _expires_at) = self._entries.popitem(last=False)
+                self._usernames_by_id.pop(evicted.employee_id, None)
+                self.evictions += 1
+
+    def invalidate(self, username: str) -> None:
+        """ Функция для удаления пользователя из кэша по username """
+        with self._lock:
+            self._remove(username)
+
+    def invalidate_id(self, employee_id: uuid.UUID) -> None:
+        """ Функция для удаления пользователя из кэша по id """
+        with self._lock:
+            self._remove_id(employee_id)
+
+    def _remove(self, username: str) -> None:
+        entry = self._entries.pop(username, None)
+        if entry is not None:
+            self._usernames_by_id.pop(entry[0].employee_id, None)
+
+    def _remove_id(self, employee_id: uuid.UUID) -> None:
+        username = self._usernames_by_id.pop(employee_id, None)
+        if username is not None:
+            self._entries.pop(username, None)
+
+    def clear(self) -> None:
+        """ Функция для очистки кэша и счетчиков """
+        with self._lock:
+            self._entries.clear()
+            self._usernames_by_id.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict:
+        """ Функция для получения статистики попаданий в кэш """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+            }
+
+
+identity_cache = IdentityCache(
+    maxsize=getattr(settings, "IDENTITY_CACHE_SIZE", 4096),
+    ttl=getattr(settings, "IDENTITY_CACHE_TTL", 60.0),
+)
+
+
+class TenderListCache:
+    """
+    Класс для кэширования страниц списка опубликованных тендеров в кэше Django.
+    Ключ включает параметры запроса и поколение тендеров: любая запись тендера увеличивает поколение
+    после коммита, и все прежние страницы перестают читаться, а потом вытесняются по TTL.
+    С локальным кэшем (LocMemCache) поколение свое у каждого процесса, поэтому для нескольких
+    процессов нужен общий кэш, например Redis или Memcached
+    """
+    generation_key = "tenders:generation"
+
+    def __init__(self, alias: str = "default", ttl: float = 300) -> None:
+        self.alias = alias
+        self.ttl = ttl
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def cache(self):
+        return caches[self.alias]
+
+    def make_key(self, query_params: QueryDict, generation: Optional[int]) -> str:
+        """ Функция для построения ключа страницы, поколение читается до запроса к базе """
+        items = sorted((key, tuple(query_params.getlist(key))) for key in query_params)
+        params = hashlib.md5(repr(items).encode()).hexdigest()
+        return f"tenders:list:{generation or 0}:{params}"
+
+    def key(self, query_params: QueryDict) -> str:
+        """ Функция для получения ключа страницы для текущего поколения """
+        return self.make_key(query_params, self.cache.get(self.generation_key))
+
+    async def akey(self, query_params: QueryDict) -> str:
+        """ Функция для получения ключа страницы в async-коде """
+        return self.make_key(query_params, await self.cache.aget(self.generation_key))
+
+    def _count(self, page: Optional[tuple]) -> Optional[tuple]:
+        with self._lock:
+            if page is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return page
+
+    def get(self, key: str) -> Optional[tuple]:
+        """ Функция для получения страницы (данные, курсор следующей страницы) """
+        return self._count(self.cache.get(key))
+
+    async def aget(self, key: str) -> Optional[tuple]:
+        """ Функция для получения страницы в async-коде """
+        return self._count(await self.cache.aget(key))
+
+    def set(self, key: str, page: tuple) -> None:
+        """ Функция для сохранения страницы """
+        self.cache.set(key, page, timeout=self.ttl)
+
+    async def aset(self, key: str, page: tuple) -> None:
+        """ Функция для сохранения страницы в async-коде """
+        await self.cache.aset(key, page, timeout=self.ttl)
+
+    def bump_generation(self) -> None:
+        """ Функция для смены поколения тендеров после коммита текущей транзакции """
+        transaction.on_commit(self._bump)
+
+    def _bump(self) -> None:
+        try:
+            self.cache.incr(self.generation_key)
+        except ValueError:
+            if not self.cache.add(self.generation_key, 1, timeout=None):
+                self.cache.incr(self.generation_key)
+
+    def clear_stats(self) -> None:
+        """ Функция для сброса счетчиков попаданий """
+        with self._lock:
+            self.hits = self.misses = 0
+
+    def stats(self) -> dict:
+        """ Функция для получения статистики попаданий в кэш """
+        generation = self.cache.get(self.generation_key) or 0
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "generation": generation,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+            }
+
+
+tender_list_cache = TenderListCache(
+    alias=getattr(settings, "TENDER_LIST_CACHE", "default"),
+    ttl=getattr(settings, "TENDER_LIST_CACHE_TTL", 300),
+)
@@ -0,0 +1,72 @@
+import threading
+
+from django.db import connections
+
+
+class ConnectionStats:
+    """
+    Класс для подсчета открытых соединений с базой и обработанных запросов.
+    Если соединения переиспользуются, opened растет намного медленнее, чем requests
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.opened = 0
+        self.requests = 0
+
+    def connection_opened(self) -> None:
+        with self._lock:
+            self.opened += 1
+
+    def request_started(self) -> None:
+        with self._lock:
+            self.requests += 1
+
+    def stats(self) -> dict:
+        """ Функция для получения счетчиков и доли запросов, которым не пришлось открывать соединение """
+        with self._lock:
+            opened, requests = self.opened, self.requests
+        return {
+            "connections_opened": opened,
+            "requests": requests,
+            "reuse_ratio": round(1 - opened / requests, 4) if requests and opened <= requests else 0.0,
+        }
+
+
+connection_stats = ConnectionStats()
+
+
+def pool_stats(alias: str = "default") -> dict:
+    """
+    Функция для получения метрик насыщения соединений.
+    Кроме счетчиков процесса возвращает статистику пула (Django 5.1+) и число соединений
+    к базе на стороне PostgreSQL относительно max_connections
+    """
+    connection = connections[alias]
+    result = {
+        **connection_stats.stats(),
+        "conn_max_age": connection.settings_dict["CONN_MAX_AGE"],
+        "health_checks": connection.settings_dict["CONN_HEALTH_CHECKS"],
+    }
+    pool = getattr(connection, "pool", None)
+    if pool is not None:
+        stats = pool.get_stats()
+        result["pool"] = {
+            "size": stats.get("pool_size", 0),
+            "available": stats.get("pool_available", 0),
+            "max_size": pool.max_size,
+            "waiting": stats.get("requests_waiting", 0),
+            "saturation": round((stats.get("pool_size", 0) - stats.get("pool_available", 0)) / pool.max_size, 4),
+        }
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT count(*), current_setting('max_connections')::int FROM pg_stat_activity "
+            "WHERE datname = current_database()"
+        )
+        server_connections, max_connections = cursor.fetchone()
+    result["server"] = {
+        "connections": server_connections,
+        "max_connections": max_connections,
+        "saturation": round(server_connections / max_connections, 4),
+    }
+    return result
@@ -0,0 +1,93 @@
+from django.db import OperationalError, transaction
+from django.db.models import Count, F, Q
+
+from .identity import Identity
+from .models import Bids, BidDecision, BidVersion, Tenders
+from .versioning import VersionConflict, update_bid, update_tender
+
+QUORUM_LIMIT = 3
+
+
+class DecisionError(Exception):
+    """ Исключение, когда решение по предложению не может быть принято """
+
+
+def get_quorum(responsible_count: int) -> int:
+    """ Функция для расчета кворума: min(3, количество ответственных за организацию) """
+    return min(QUORUM_LIMIT, responsible_count)
+
+
+def submit_decision(bid: Bids, identity: Identity, decision: str) -> Bids:
+    """
+    Функция для принятия решения ответственным за организацию тендера.
+    Предложение отклоняется при первом Rejected и согласуется, когда согласований не меньше кворума.
+    При согласовании тендер закрывается, а остальные предложения по нему отменяются.
+    Число запросов не зависит от размера организации и количества решений:
+    количество ответственных берется из Organization.responsible_count.
+    Взаимная блокировка или таймаут блокировки выбрасываются как VersionConflict
+    """
+    try:
+        return lock_and_decide(bid, identity, decision)
+    except OperationalError as e:
+        raise VersionConflict(f"Предложение изменяется параллельно, повторите запрос: {e}") from e
+
+
+@transaction.atomic
+def lock_and_decide(bid: Bids, identity: Identity, decision: str) -> Bids:
+    """
+    Функция для принятия решения под блокировками.
+    Первой блокируется строка тендера, затем предложение: решения по предложениям одного тендера
+    выполняются по очереди, и согласование не ждет блокировку соседнего предложения,
+    которую держит параллельное решение
+    """
+    tender = (Tenders.objects.select_related("organizationId").select_for_update(of=("self",))
+              .get(tenderId=bid.tenderId_id))
+    bid = Bids.objects.select_for_update().get(bidId=bid.bidId)
+    bid.tenderId = tender
+    if bid.bidStatus == "Canceled" or bid.bidDecision or tender.tenderStatus == "Closed":
+        raise DecisionError("Решение по предложению уже принято")
+
+    BidDecision.objects.bulk_create(
+        [BidDecision(bidId_id=bid.bidId, responsibleId_id=identity.employee_id, decision=decision)],
+        update_conflicts=True, unique_fields=["bidId", "responsibleId"], update_fields=["decision", "createdAt"],
+    )
+    tally = BidDecision.objects.filter(bidId_id=bid.bidId).aggregate(
+        approvals=Count("id", filter=Q(decision="Approved")),
+        rejections=Count("id", filter=Q(decision="Rejected")),
+    )
+
+    if tally["rejections"]:
+        return update_bid(bid, bidDecision="Rejected", bidStatus="Canceled")
+    responsible_count = tender.organizationId.responsible_count if tender.organizationId_id else 0
+    if tally["approvals"] < get_quorum(max(responsible_count, 1)):
+        return bid
+
+    bid = update_bid(bid, bidDecision="Approved")
+    update_tender(tender, tenderStatus="Closed")
+    cancel_competing_bids(bid)
+    return bid
+
+
+def cancel_competing_bids(bid: Bids) -> None:
+    """
+    Функция для отмены остальных предложений по тендеру одним UPDATE и одной вставкой в историю.
+    Строки блокируются в порядке bidId, чтобы параллельные транзакции брали блокировки в одном порядке
+    """
+    competing = list(
+        Bids.objects.select_for_update()
+        .filter(tenderId_id=bid.tenderId_id)
+        .exclude(bidId=bid.bidId)
+        .exclude(bidStatus="Canceled")
+        .order_by("bidId")
+        .values("bidId", "bidName", "bidDescription", "bidDecision", "bidVersion")
+    )
+    if not competing:
+        return
+    Bids.objects.filter(bidId__in=[row["bidId"] for row in competing]).update(
+        bidStatus="Canceled", bidVersion=F("bidVersion") + 1
+    )
+    BidVersion.objects.bulk_create([
+        BidVersion(bidId_id=row["bidId"], bidName=row["bidName"], bidDescription=row["bidDescription"],
+                   bidStatus="Canceled", bidDecision=row["bidDecision"], bidVersion=row["bidVersion"] + 1)
+        for row in competing
+    ])
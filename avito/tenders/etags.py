@@ -0,0 +1,76 @@
+import hashlib
+from typing import Iterable, Optional
+
+from django.db.models import QuerySet
+from django.utils.http import parse_etags
+from rest_framework.status import HTTP_200_OK, HTTP_304_NOT_MODIFIED
+
+from .pagination import CustomPagination
+from .serializers import FastSerializer
+
+
+def make_etag(*parts) -> str:
+    """ Функция для формирования ETag из значений, которые однозначно определяют ответ """
+    return '"%s"' % hashlib.md5(repr(parts).encode(), usedforsecurity=False).hexdigest()
+
+
+def entity_etag(pk, version: int) -> str:
+    """ Функция для формирования ETag объекта: любое изменение объекта увеличивает его версию """
+    return make_etag(str(pk), version)
+
+
+def page_etag(keys: Iterable[tuple], next_cursor: Optional[str]) -> str:
+    """
+    Функция для формирования ETag страницы списка из (id, версия) ее строк и курсора следующей страницы.
+    Строка страницы меняется только вместе с версией, а состав страницы - вместе со списком id
+    """
+    return make_etag([(str(pk), version) for pk, version in keys], next_cursor)
+
+
+def rows_etag(data: list, next_cursor: Optional[str]) -> str:
+    """ Функция для формирования ETag уже сериализованной страницы, совпадает с page_etag по ее строкам """
+    return page_etag(((row["id"], row["version"]) for row in data), next_cursor)
+
+
+def etag_rows(queryset: QuerySet, serializer: FastSerializer) -> QuerySet:
+    """
+    Функция для выборки только id, версии и ключа сортировки строк вместо полных строк:
+    этого достаточно, чтобы посчитать ETag страницы и курсор следующей страницы
+    """
+    fields = dict(zip(serializer.keys, serializer.columns))
+    order_by = (field.lstrip("-") for field in queryset.query.order_by)
+    return queryset.values_list(*dict.fromkeys((fields["id"], fields["version"], *order_by)))
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """ Функция для слабого сравнения ETag с заголовком If-None-Match """
+    if not if_none_match:
+        return False
+    etags = parse_etags(if_none_match)
+    return "*" in etags or etag in (tag.removeprefix("W/") for tag in etags)
+
+
+def unchanged_page_etag(if_none_match: Optional[str], keys: Iterable[tuple],
+                        next_cursor: Optional[str]) -> Optional[str]:
+    """ Функция для проверки страницы по строкам из etag_rows, возвращает ETag, если у клиента актуальная версия """
+    etag = page_etag((row[:2] for row in keys), next_cursor)
+    return etag if etag_matches(if_none_match, etag) else None
+
+
+def serialize_page(serializer: FastSerializer, rows: list, next_cursor: Optional[str]) -> tuple:
+    """ Функция для сериализации страницы в (данные, курсор следующей страницы, ETag), в этом виде ее хранит кэш """
+    data = serializer.serialize_rows(rows)
+    return data, next_cursor, rows_etag(data, next_cursor)
+
+
+def conditional_result(if_none_match: Optional[str], data, next_cursor: Optional[str], etag: str) -> tuple:
+    """
+    Функция для выбора ответа с ETag: (статус, данные, заголовки).
+    Если у клиента актуальная версия, возвращается 304 без данных, иначе данные и курсор следующей страницы
+    """
+    headers = {"ETag": etag}
+    if etag_matches(if_none_match, etag):
+        return HTTP_304_NOT_MODIFIED, None, headers
+    if next_cursor is not None:
+        headers[CustomPagination.cursor_header] = next_cursor
+    return HTTP_200_OK, data, headers
@@ -0,0 +1,62 @@
+from itertools import islice
+from typing import AsyncIterator, Iterator
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import transaction
+from django.db.models import QuerySet
+from django.http import HttpResponse, StreamingHttpResponse
+from rest_framework.renderers import BaseRenderer
+
+from .renderers import CSVRenderer, FastJSONRenderer, NDJSONRenderer
+from .serializers import FastSerializer
+
+# Первый формат используется по умолчанию, другой выбирается через ?format=csv или заголовок Accept
+EXPORT_RENDERERS = [NDJSONRenderer, CSVRenderer]
+
+
+def stream_rows(queryset: QuerySet, serializer: FastSerializer, renderer: BaseRenderer) -> Iterator[bytes]:
+    """
+    Функция для потоковой выгрузки строк списка.
+    Строки читаются серверным курсором пачками по EXPORT_CHUNK_SIZE и сериализуются пачками,
+    поэтому память не зависит от числа строк. Курсор открывается в транзакции: вне ее Django объявляет
+    курсор WITH HOLD, и PostgreSQL материализует весь результат до выдачи первой строки
+    """
+    chunk_size = getattr(settings, "EXPORT_CHUNK_SIZE", 2000)
+    header = renderer.render([], renderer_context={"fields": serializer.keys, "header": True})
+    if header:
+        yield header
+    context = {"fields": serializer.keys, "header": False}
+    # База выбирается роутером один раз: транзакция и серверный курсор должны идти в одно соединение
+    alias = queryset.db
+    queryset = queryset.using(alias)
+    with transaction.atomic(using=alias):
+        rows = serializer.rows(queryset).iterator(chunk_size=chunk_size)
+        while batch := list(islice(rows, chunk_size)):
+            yield renderer.render(serializer.serialize_rows(batch), renderer_context=context)
+
+
+async def astream_rows(queryset: QuerySet, serializer: FastSerializer, renderer: BaseRenderer) -> AsyncIterator[bytes]:
+    """
+    Функция для потоковой выгрузки под ASGI: шаги stream_rows выполняются в потоке для синхронного ORM,
+    так транзакция и серверный курсор остаются в одном соединении. При обрыве соединения транзакция закрывается
+    """
+    chunks = stream_rows(queryset, serializer, renderer)
+    next_chunk = sync_to_async(next)
+    try:
+        while (chunk := await next_chunk(chunks, None)) is not None:
+            yield chunk
+    finally:
+        await sync_to_async(chunks.close)()
+
+
+def export_response(content, renderer: BaseRenderer, filename: str) -> StreamingHttpResponse:
+    """ Функция для потокового ответа с выгрузкой в виде файла """
+    response = StreamingHttpResponse(content, content_type=f"{renderer.media_type}; charset={renderer.charset}")
+    response["Content-Disposition"] = f'attachment; filename="{filename}.{renderer.format}"'
+    return response
+
+
+def export_error(data: dict, status: int) -> HttpResponse:
+    """ Функция для ответа с ошибкой выгрузки в JSON, как у остальных маршрутов, независимо от формата выгрузки """
+    return HttpResponse(FastJSONRenderer().render(data), status=status, content_type="application/json")
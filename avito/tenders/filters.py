@@ -1,10 +1,47 @@
+from django.db.models import QuerySet
 from django_filters import rest_framework as filters
 
 from .models import Tenders
+from .search import search
+
+# Черновики (Created) видны только в /tenders/my, закрытые (Closed) - только ответственным организации,
+# поэтому публичный список показывает одни опубликованные тендеры
+PUBLIC_TENDER_STATUSES = [(status, label) for status, label in Tenders.TENDER_STATUS if status == "Published"]
+DEFAULT_TENDER_STATUS = "Published"
+
+
+class ChoiceInFilter(filters.BaseInFilter, filters.ChoiceFilter):
+    """ Класс для фильтра по нескольким значениям из списка через запятую (SQL IN) """
+
+
+class UUIDInFilter(filters.BaseInFilter, filters.UUIDFilter):
+    """ Класс для фильтра по нескольким UUID через запятую (SQL IN) """
 
 
 class TenderFilter(filters.FilterSet):
-    """ Класс для фильтрации тендеров """
+    """
+    Класс для фильтрации публичного списка тендеров.
+    Все параметры применяются в одном запросе: service_type, status и organization_id принимают
+    несколько значений через запятую, created_at_after/created_at_before задают диапазон даты создания.
+    Публичный список всегда содержит только опубликованные тендеры, поэтому status ничего не сужает и оставлен
+    только для совместимости API: status=Published принимается, а другие статусы, как и раньше, дают 400
+    """
+    service_type = ChoiceInFilter(field_name="tenderServiceType", choices=Tenders.TENDER_SERVICE_TYPE)
+    status = ChoiceInFilter(field_name="tenderStatus", choices=PUBLIC_TENDER_STATUSES)
+    organization_id = UUIDInFilter(field_name="organizationId")
+    created_at = filters.IsoDateTimeFromToRangeFilter(field_name="created_at")
+    search = filters.CharFilter(method="filter_search")
+
     class Meta:
         model = Tenders
-        fields = ["filterServiceType"]
\ No newline at end of file
+        fields = ["service_type", "status", "organization_id", "created_at", "search"]
+
+    def filter_queryset(self, queryset: QuerySet) -> QuerySet:
+        if not self.form.cleaned_data.get("status"):
+            queryset = queryset.filter(tenderStatus=DEFAULT_TENDER_STATUS)
+        return super().filter_queryset(queryset)
+
+    def filter_search(self, queryset: QuerySet, name: str, value: str) -> QuerySet:
+        """ Функция для полнотекстового поиска, применяется последней и сортирует по релевантности """
+        value = value.strip()
+        return search(queryset, value) if value else queryset
@@ -0,0 +1,169 @@
+import uuid
+from typing import Optional, Union
+
+from django.db.models import QuerySet
+from django.http import HttpRequest
+from rest_framework.status import HTTP_401_UNAUTHORIZED, HTTP_403_FORBIDDEN
+
+from .cache import identity_cache
+from .models import Employee, Tenders, Bids
+
+# Ошибки доступа в виде (статус, тело ответа), ответ из них строят sync- и async-представления
+UNAUTHORIZED = (HTTP_401_UNAUTHORIZED, {"reason": "Пользователь не существует или некорректен."})
+FORBIDDEN = (HTTP_403_FORBIDDEN, {"reason": "Недостаточно прав для выполнения действия."})
+
+# Признак промаха кэша: None в запросе означает, что пользователь уже искался и не найден
+_MISSING = object()
+
+
+class Identity:
+    """ Класс для хранения данных о пользователе и организациях, за которые он отвечает """
+    __slots__ = ("employee_id", "username", "organization_ids")
+
+    def __init__(self, employee_id: uuid.UUID, username: str, organization_ids: frozenset) -> None:
+        self.employee_id = employee_id
+        self.username = username
+        self.organization_ids = organization_ids
+
+    def is_responsible_for(self, organization_id: Union[uuid.UUID, str, None]) -> bool:
+        """ Функция для проверки, отвечает ли пользователь за организацию """
+        return parse_uuid(organization_id) in self.organization_ids
+
+    def __repr__(self) -> str:
+        return f"Identity(username={self.username!r}, organizations={len(self.organization_ids)})"
+
+
+def parse_uuid(value: Union[uuid.UUID, str, None]) -> Optional[uuid.UUID]:
+    """ Функция для приведения идентификатора из запроса к UUID, возвращает None для некорректных """
+    if value is None or isinstance(value, uuid.UUID):
+        return value
+    try:
+        return uuid.UUID(str(value))
+    except ValueError:
+        return None
+
+
+def _identity_lookup(**lookup: str) -> QuerySet:
+    """ Функция для получения запроса пользователя вместе с организациями, за которые он отвечает """
+    return Employee.objects.filter(**lookup).values_list(
+        "id", "username", "organizationresponsible__organization_id"
+    )
+
+
+def _build_identity(rows: list) -> Optional[Identity]:
+    """ Функция для сборки пользователя из строк _identity_lookup """
+    if not rows:
+        return None
+    employee_id, username, _ = rows[0]
+    organization_ids = frozenset(organization_id for _, _, organization_id in rows if organization_id is not None)
+    return Identity(employee_id=employee_id, username=username, organization_ids=organization_ids)
+
+
+def load_identity(**lookup: str) -> Optional[Identity]:
+    """
+    Функция для получения пользователя и его организаций одним запросом.
+    Принимает username=... или id=... и возвращает None, если пользователь не найден
+    """
+    return _build_identity(list(_identity_lookup(**lookup)))
+
+
+async def aload_identity(**lookup: str) -> Optional[Identity]:
+    """ Функция для получения пользователя через асинхронный ORM, работает как load_identity """
+    return _build_identity([row async for row in _identity_lookup(**lookup)])
+
+
+def _request_memo(request: HttpRequest) -> dict:
+    """ Функция для получения словаря, в котором пользователи запоминаются на время запроса """
+    request = getattr(request, "_request", request)
+    memo = getattr(request, "_identity_memo", None)
+    if memo is None:
+        memo = {}
+        request._identity_memo = memo
+    return memo
+
+
+def _memoize(memo: dict, key: tuple, identity: Optional[Identity]) -> Optional[Identity]:
+    """ Функция для запоминания пользователя в запросе сразу по username и по id """
+    memo[key] = identity
+    if identity is not None:
+        memo[("username", identity.username)] = identity
+        memo[("id", identity.employee_id)] = identity
+    return identity
+
+
+def _cached_identity(memo: dict, key: tuple) -> Optional[Identity]:
+    """
+    Функция для поиска пользователя в запросе, затем в кэше процесса.
+    Возвращает _MISSING, если пользователя нужно загрузить из базы
+    """
+    if key in memo:
+        return memo[key]
+    field, value = key
+    identity = identity_cache.get(value) if field == "username" else identity_cache.get_by_id(value)
+    return _MISSING if identity is None else _memoize(memo, key, identity)
+
+
+def _loaded_identity(memo: dict, key: tuple, identity: Optional[Identity]) -> Optional[Identity]:
+    """ Функция для сохранения загруженного из базы пользователя в кэше процесса и в запросе """
+    if identity is not None:
+        identity_cache.set(identity)
+    return _memoize(memo, key, identity)
+
+
+def _find_identity(request: HttpRequest, field: str, value) -> Optional[Identity]:
+    """ Функция для получения пользователя по username или id: запрос, кэш процесса, затем база """
+    memo = _request_memo(request)
+    key = (field, value)
+    identity = _cached_identity(memo, key)
+    if identity is _MISSING:
+        identity = _loaded_identity(memo, key, load_identity(**{field: value}))
+    return identity
+
+
+def get_identity(request: HttpRequest, username: Optional[str]) -> Optional[Identity]:
+    """
+    Функция для получения пользователя по username.
+    Сначала ищет в запросе, затем в кэше процесса и только потом обращается к базе.
+    username из тела запроса может быть любым JSON-значением, пользователем считается только непустая строка
+    """
+    if not isinstance(username, str) or not username:
+        return None
+    return _find_identity(request, "username", username)
+
+
+def get_identity_by_id(request: HttpRequest, employee_id: Union[uuid.UUID, str, None]) -> Optional[Identity]:
+    """ Функция для получения пользователя по id, порядок поиска как в get_identity """
+    employee_id = parse_uuid(employee_id)
+    if employee_id is None:
+        return None
+    return _find_identity(request, "id", employee_id)
+
+
+async def aget_identity(request: HttpRequest, username: Optional[str]) -> Optional[Identity]:
+    """ Функция для получения пользователя по username в async-представлениях, работает как get_identity """
+    if not isinstance(username, str) or not username:
+        return None
+    memo = _request_memo(request)
+    key = ("username", username)
+    identity = _cached_identity(memo, key)
+    if identity is _MISSING:
+        identity = _loaded_identity(memo, key, await aload_identity(username=username))
+    return identity
+
+
+def tender_access_error(identity: Optional[Identity], tender: Tenders) -> Optional[tuple]:
+    """ Функция для проверки прав на тендер: создатель или ответственный за организацию, возвращает ошибку или None """
+    if identity is None:
+        return UNAUTHORIZED
+    if identity.username != tender.creatorUsername and not identity.is_responsible_for(tender.organizationId_id):
+        return FORBIDDEN
+    return None
+
+
+def bid_access_error(identity: Optional[Identity], bid: Bids) -> Optional[tuple]:
+    """ Функция для проверки прав на предложение: автор и ответственный за организацию, возвращает ошибку или None """
+    if identity is None or identity.employee_id != bid.bidAuthorId_id:
+        return UNAUTHORIZED
+    if not identity.is_responsible_for(bid.organizationId_id):
+        return FORBIDDEN
+    return None
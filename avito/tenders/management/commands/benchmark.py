@@ -0,0 +1,60 @@
+import json
+import subprocess
+
+from django.core.management.base import BaseCommand, CommandError
+
+from tenders.benchmarks import SUITES, find_regressions, run_suite
+
+
+def current_commit() -> str:
+    """ Функция для определения коммита, на котором получен результат """
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+class Command(BaseCommand):
+    """ Класс команды для замеров производительности, изменения в базе откатываются """
+    help = "Запускает наборы замеров производительности и выводит результат в JSON"
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("suites", nargs="*", help=f"Наборы замеров: {', '.join(sorted(SUITES))}, по умолчанию все")
+        parser.add_argument("--items", type=int, default=500, help="Количество объектов в замере")
+        parser.add_argument("--batch", type=int, default=100, help="Размер пачки для пакетных запросов")
+        parser.add_argument("--base-url", help="Адрес запущенного сервера для набора endpoints, например "
+                                               "http://127.0.0.1:8000; без него маршруты вызываются в процессе")
+        parser.add_argument("--concurrency", type=int, default=1,
+                            help="Количество одновременных клиентов для набора endpoints с --base-url")
+        parser.add_argument("--output", help="Файл для сохранения результата")
+        parser.add_argument("--baseline", help="Результат другого коммита для сравнения задержек")
+        parser.add_argument("--threshold", type=float, default=20.0,
+                            help="Допустимый рост задержки относительно --baseline в процентах")
+
+    def handle(self, *args, **options) -> None:
+        unknown = set(options["suites"]) - set(SUITES)
+        if unknown:
+            raise CommandError(f"Неизвестные наборы замеров: {', '.join(sorted(unknown))}")
+        results = {}
+        for name in options["suites"] or sorted(SUITES):
+            results[name] = run_suite(name, items=options["items"], batch=options["batch"],
+                                      base_url=options["base_url"], concurrency=options["concurrency"])
+        report = {
+            "meta": {"commit": current_commit(), "items": options["items"], "batch": options["batch"]},
+            **results,
+        }
+        output = json.dumps(report, ensure_ascii=False, indent=2)
+        self.stdout.write(output)
+        if options["output"]:
+            with open(options["output"], "w", encoding="utf-8") as file:
+                file.write(output)
+
+        if options["baseline"]:
+            with open(options["baseline"], encoding="utf-8") as file:
+                baseline = json.load(file)
+            regressions = find_regressions(baseline, results, options["threshold"])
+            for regression in regressions:
+                self.stderr.write(regression)
+            if regressions:
+                raise CommandError(f"Задержка выросла больше чем на {options['threshold']}%: {len(regressions)}")
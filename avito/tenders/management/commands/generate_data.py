@@ -0,0 +1,55 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from tenders.models import Employee
+from tenders.synthetic import SyntheticDataset
+
+
+class Command(BaseCommand):
+    """ Класс команды для генерации воспроизводимого набора данных для нагрузочных замеров """
+    help = ("Генерирует организации, пользователей, ответственных, тендеры, предложения и отзывы. "
+            "Строки вставляются пачками командой COPY (без psycopg 3 - через bulk_create). "
+            "Одинаковые параметры и --seed дают одинаковые данные")
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--organizations", type=int, default=100, help="Количество организаций")
+        parser.add_argument("--employees", type=int, default=1000, help="Количество пользователей")
+        parser.add_argument("--responsibles", type=int, default=500,
+                            help="Сколько первых пользователей назначить ответственными за организации")
+        parser.add_argument("--tenders", type=int, default=10000, help="Количество тендеров")
+        parser.add_argument("--bids", type=int, default=50000, help="Количество предложений")
+        parser.add_argument("--reviews", type=int, default=10000, help="Количество отзывов")
+        parser.add_argument("--seed", type=int, default=0, help="Зерно генерации")
+        parser.add_argument("--prefix", default="load", help="Префикс имен пользователей и организаций")
+        parser.add_argument("--skew", type=float, default=2.0,
+                            help="Неравномерность связей: 1 - равномерно, больше - сильнее перекос к малым номерам")
+        parser.add_argument("--batch", type=int, default=5000, help="Размер пачки вставки")
+
+    def handle(self, *args, **options) -> None:
+        try:
+            dataset = SyntheticDataset(
+                organizations=options["organizations"], employees=options["employees"],
+                responsibles=options["responsibles"], tenders=options["tenders"], bids=options["bids"],
+                reviews=options["reviews"], seed=options["seed"], prefix=options["prefix"], skew=options["skew"],
+            )
+        except ValueError as error:
+            raise CommandError(str(error))
+        if Employee.objects.filter(username=dataset.username(0)).exists():
+            raise CommandError(f"Набор с префиксом {dataset.prefix} уже создан, укажите другой --prefix")
+
+        verbosity = options["verbosity"]
+
+        def progress(table: str, inserted: int) -> None:
+            if verbosity > 1:
+                self.stdout.write(f"{table}: {inserted}")
+
+        started = time.perf_counter()
+        counts = dataset.generate(batch=options["batch"], progress=progress)
+        elapsed = time.perf_counter() - started
+        total = sum(counts.values())
+        for table, count in counts.items():
+            self.stdout.write(f"{table}: {count}")
+        self.stdout.write(self.style.SUCCESS(
+            f"Создано строк: {total} за {elapsed:.1f} с ({total / elapsed:.0f} строк/с, без учета версий)"
+        ))
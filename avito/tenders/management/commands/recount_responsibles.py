@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from tenders.models import Organization, OrganizationResponsible
+
+
+class Command(BaseCommand):
+    """ Класс команды для пересчета и проверки количества ответственных за организации """
+    help = "Пересчитывает Organization.responsible_count одним UPDATE или проверяет его с --check"
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--check", action="store_true",
+                            help="Только проверить счетчики и завершиться с ошибкой при расхождении")
+
+    def handle(self, *args, **options) -> None:
+        counts = (OrganizationResponsible.objects.filter(organization_id=OuterRef("pk")).order_by()
+                  .values("organization_id").annotate(count=Count("pk")).values("count"))
+        expected = Coalesce(Subquery(counts), 0)
+
+        if options["check"]:
+            mismatched = list(
+                Organization.objects.annotate(expected=expected).exclude(responsible_count=F("expected"))
+                .values_list("id", "responsible_count", "expected")[:20]
+            )
+            if mismatched:
+                for organization_id, stored, actual in mismatched:
+                    self.stderr.write(f"{organization_id}: сохранено {stored}, фактически {actual}")
+                raise CommandError("Количество ответственных не совпадает, запустите команду без --check")
+            self.stdout.write(self.style.SUCCESS("Количество ответственных совпадает"))
+            return
+
+        updated = Organization.objects.update(responsible_count=expected)
+        self.stdout.write(self.style.SUCCESS(f"Пересчитано организаций: {updated}"))
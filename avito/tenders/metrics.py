@@ -0,0 +1,142 @@
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from typing import Callable, Iterable, Optional
+
+# Границы корзин гистограммы задержки в секундах, последняя корзина - +Inf
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Запросы, не попавшие в маршруты tenders/urls.py (admin, 404), считаются вместе
+OTHER_ENDPOINT = "other"
+# Точки сохранения вложенных transaction.atomic управляют транзакцией и не читают данные,
+# в бюджет запросов они не входят ни в middleware, ни в тестах
+TRANSACTION_STATEMENTS = ("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT")
+
+
+def is_data_query(sql: str) -> bool:
+    """ Функция для отделения запросов к данным от управления транзакцией """
+    return not sql.startswith(TRANSACTION_STATEMENTS)
+
+
+class RequestQueries:
+    """ Класс для подсчета SQL-запросов текущего HTTP-запроса """
+    __slots__ = ("count", "seconds")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.seconds = 0.0
+
+
+current_queries: ContextVar[Optional[RequestQueries]] = ContextVar("current_queries", default=None)
+
+
+def record_query(execute: Callable, sql: str, params, many: bool, context: dict):
+    """
+    Функция-обертка для connection.execute_wrappers: считает запросы и их время для текущего HTTP-запроса.
+    Счетчик берется из ContextVar, поэтому учитываются и запросы async ORM из потоков sync_to_async
+    """
+    queries = current_queries.get()
+    if queries is None or not is_data_query(sql):
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        queries.count += 1
+        queries.seconds += time.perf_counter() - started
+
+
+def install_query_wrapper(connection) -> None:
+    """ Функция для однократной установки record_query на соединение любого алиаса (основная база и реплики) """
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+
+
+class EndpointMetrics:
+    """
+    Класс для метрик одного маршрута: гистограмма задержки, число SQL-запросов, время SQL
+    и число превышений бюджета запросов. Все счетчики создаются заранее, запись в них не выделяет память
+    """
+    __slots__ = ("name", "budget", "buckets", "requests", "seconds", "queries", "query_seconds",
+                 "budget_exceeded", "lock")
+
+    def __init__(self, name: str, budget: int) -> None:
+        self.name = name
+        self.budget = budget
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.requests = 0
+        self.seconds = 0.0
+        self.queries = 0
+        self.query_seconds = 0.0
+        self.budget_exceeded = 0
+        self.lock = threading.Lock()
+
+    def observe(self, seconds: float, queries: int, query_seconds: float) -> bool:
+        """ Функция для учета запроса, возвращает True, если превышен бюджет SQL-запросов """
+        exceeded = queries > self.budget
+        with self.lock:
+            self.buckets[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+            self.requests += 1
+            self.seconds += seconds
+            self.queries += queries
+            self.query_seconds += query_seconds
+            if exceeded:
+                self.budget_exceeded += 1
+        return exceeded
+
+    def snapshot(self) -> tuple:
+        """ Функция для согласованного чтения счетчиков """
+        with self.lock:
+            return (list(self.buckets), self.requests, self.seconds, self.queries, self.query_seconds,
+                    self.budget_exceeded)
+
+
+class MetricsRegistry:
+    """ Класс для метрик всех маршрутов, заполняется один раз при загрузке middleware """
+
+    def __init__(self) -> None:
+        self.endpoints = {}
+
+    def preallocate(self, names: Iterable[str], default_budget: int, budgets: dict) -> None:
+        """ Функция для создания счетчиков маршрутов, уже созданные не сбрасываются """
+        for name in [*names, OTHER_ENDPOINT]:
+            if name not in self.endpoints:
+                self.endpoints[name] = EndpointMetrics(name, budgets.get(name, default_budget))
+
+    def get(self, name: Optional[str]) -> EndpointMetrics:
+        """ Функция для получения счетчиков маршрута, неизвестные маршруты попадают в other """
+        return self.endpoints.get(name) or self.endpoints[OTHER_ENDPOINT]
+
+    def render(self) -> str:
+        """ Функция для вывода метрик в текстовом формате Prometheus """
+        bounds = [repr(bound) for bound in LATENCY_BUCKETS] + ["+Inf"]
+        latency, queries, query_seconds, exceeded = [], [], [], []
+        for name, endpoint in sorted(self.endpoints.items()):
+            buckets, requests, seconds, query_count, query_time, budget_exceeded = endpoint.snapshot()
+            label = f'endpoint="{name}"'
+            total = 0
+            for bound, count in zip(bounds, buckets):
+                total += count
+                latency.append(f'tenders_request_duration_seconds_bucket{{{label},le="{bound}"}} {total}')
+            latency.append(f"tenders_request_duration_seconds_sum{{{label}}} {seconds}")
+            latency.append(f"tenders_request_duration_seconds_count{{{label}}} {requests}")
+            queries.append(f"tenders_db_queries_total{{{label}}} {query_count}")
+            query_seconds.append(f"tenders_db_query_duration_seconds_total{{{label}}} {query_time}")
+            exceeded.append(f"tenders_query_budget_exceeded_total{{{label}}} {budget_exceeded}")
+        return "\n".join([
+            "# HELP tenders_request_duration_seconds Request latency by endpoint.",
+            "# TYPE tenders_request_duration_seconds histogram",
+            *latency,
+            "# HELP tenders_db_queries_total SQL queries executed by endpoint.",
+            "# TYPE tenders_db_queries_total counter",
+            *queries,
+            "# HELP tenders_db_query_duration_seconds_total Time spent in SQL queries by endpoint.",
+            "# TYPE tenders_db_query_duration_seconds_total counter",
+            *query_seconds,
+            "# HELP tenders_query_budget_exceeded_total Requests that exceeded the endpoint SQL query budget.",
+            "# TYPE tenders_query_budget_exceeded_total counter",
+            *exceeded,
+        ]) + "\n"
+
+
+metrics_registry = MetricsRegistry()
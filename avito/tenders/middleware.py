@@ -0,0 +1,117 @@
+import logging
+import time
+from typing import Callable, Iterator
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse
+from django.urls import URLResolver, get_resolver
+
+from .metrics import RequestQueries, current_queries, metrics_registry
+from .routers import use_primary, pin_to_primary, apin_to_primary, is_pinned_to_primary, ais_pinned_to_primary
+
+UNSAFE_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+USERNAME_PARAMS = ("username", "requesterUsername", "authorUsername")
+
+logger = logging.getLogger(__name__)
+
+
+def request_usernames(request: HttpRequest) -> list:
+    """ Функция для получения пользователей, указанных в параметрах запроса """
+    return [request.GET.get(param) for param in USERNAME_PARAMS]
+
+
+def written_usernames(request: HttpRequest, response: HttpResponse) -> list:
+    """ Функция для получения пользователей, которых нужно закрепить за основной базой после записи """
+    if request.method not in UNSAFE_METHODS or response.status_code >= 400:
+        return []
+    memo = getattr(request, "_identity_memo", {})
+    return request_usernames(request) + [identity.username for identity in memo.values() if identity is not None]
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Класс для выбора базы на время запроса.
+    Изменяющие запросы читают из основной базы и после успешного ответа закрепляют за ней
+    своих пользователей, чтения закрепленных пользователей тоже идут в основную базу
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response: Callable) -> None:
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        primary = request.method in UNSAFE_METHODS or is_pinned_to_primary(request_usernames(request))
+        with use_primary(primary):
+            response = self.get_response(request)
+        pin_to_primary(written_usernames(request, response))
+        return response
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        primary = request.method in UNSAFE_METHODS or await ais_pinned_to_primary(request_usernames(request))
+        with use_primary(primary):
+            response = await self.get_response(request)
+        await apin_to_primary(written_usernames(request, response))
+        return response
+
+
+def url_names(resolver: URLResolver) -> Iterator[str]:
+    """ Функция для обхода имен всех маршрутов, включая вложенные через include() """
+    for pattern in resolver.url_patterns:
+        if isinstance(pattern, URLResolver):
+            yield from url_names(pattern)
+        elif pattern.name:
+            yield pattern.name
+
+
+class MetricsMiddleware:
+    """
+    Класс для сбора метрик по маршрутам: задержка, число и время SQL-запросов.
+    Запросы считает обертка record_query на соединениях, а счетчики маршрутов создаются при загрузке,
+    поэтому на запрос выделяется только RequestQueries. При превышении бюджета SQL-запросов пишется предупреждение
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response: Callable) -> None:
+        self.get_response = get_response
+        metrics_registry.preallocate(url_names(get_resolver()), settings.QUERY_BUDGET, settings.QUERY_BUDGETS)
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        queries = RequestQueries()
+        token = current_queries.set(queries)
+        started = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            current_queries.reset(token)
+        self.observe(request, time.perf_counter() - started, queries)
+        return response
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        queries = RequestQueries()
+        token = current_queries.set(queries)
+        started = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            current_queries.reset(token)
+        self.observe(request, time.perf_counter() - started, queries)
+        return response
+
+    @staticmethod
+    def observe(request: HttpRequest, seconds: float, queries: RequestQueries) -> None:
+        resolver_match = request.resolver_match
+        endpoint = metrics_registry.get(resolver_match.url_name if resolver_match is not None else None)
+        if endpoint.observe(seconds, queries.count, queries.seconds):
+            logger.warning("Маршрут %s выполнил %d SQL-запросов при бюджете %d: %s %s",
+                           endpoint.name, queries.count, endpoint.budget, request.method, request.path)
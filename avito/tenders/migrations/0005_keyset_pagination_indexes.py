@@ -0,0 +1,27 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tenders', '0004_alter_bids_bidid_alter_employee_id_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='tenders',
+            index=models.Index(fields=['tenderName', 'tenderId'], name='tenders_name_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tenders',
+            index=models.Index(fields=['creatorUsername', 'tenderName', 'tenderId'], name='tenders_creator_name_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='bids',
+            index=models.Index(fields=['bidAuthorId', 'bidName', 'bidId'], name='bids_author_name_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='bids',
+            index=models.Index(fields=['tenderId', 'bidName', 'bidId'], name='bids_tender_name_id_idx'),
+        ),
+    ]
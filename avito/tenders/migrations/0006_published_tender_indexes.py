@@ -0,0 +1,23 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tenders', '0005_keyset_pagination_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='tenders',
+            name='tenders_name_id_idx',
+        ),
+        migrations.AddIndex(
+            model_name='tenders',
+            index=models.Index(condition=models.Q(('tenderStatus', 'Published')), fields=['tenderName', 'tenderId'], name='tenders_published_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tenders',
+            index=models.Index(condition=models.Q(('tenderStatus', 'Published')), fields=['tenderServiceType', 'tenderName', 'tenderId'], name='tenders_published_type_idx'),
+        ),
+    ]
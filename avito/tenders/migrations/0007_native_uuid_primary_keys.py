@@ -0,0 +1,60 @@
+# Generated by Django 4.2.5 on 2026-10-18 20:07
+
+from django.db import migrations, models
+import uuid
+
+
+UUID_PRIMARY_KEYS = [
+    ("tenders_tenders", "tenderId"),
+    ("tenders_employee", "id"),
+    ("tenders_bids", "bidId"),
+    ("tenders_organization", "id"),
+    ("tenders_organizationresponsible", "id"),
+    ("tenders_reviews", "bidReviewId"),
+]
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tenders', '0006_published_tender_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='bids',
+            name='bidId',
+            field=models.UUIDField(default=uuid.uuid4, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='employee',
+            name='id',
+            field=models.UUIDField(default=uuid.uuid4, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='organization',
+            name='id',
+            field=models.UUIDField(default=uuid.uuid4, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='organizationresponsible',
+            name='id',
+            field=models.UUIDField(default=uuid.uuid4, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='reviews',
+            name='bidReviewId',
+            field=models.UUIDField(default=uuid.uuid4, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='tenders',
+            name='tenderId',
+            field=models.UUIDField(default=uuid.uuid4, primary_key=True, serialize=False),
+        ),
+    ] + [
+        migrations.RunSQL(
+            sql=f'ALTER TABLE "{table}" ALTER COLUMN "{column}" SET DEFAULT gen_random_uuid()',
+            reverse_sql=f'ALTER TABLE "{table}" ALTER COLUMN "{column}" DROP DEFAULT',
+        )
+        for table, column in UUID_PRIMARY_KEYS
+    ]
@@ -0,0 +1,78 @@
+# Generated by Django 4.2.5 on 2026-10-18 20:08
+
+import itertools
+
+import django.core.validators
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def _bulk_create_in_batches(model, objs, batch_size=2000):
+    """ Вставляет объекты пачками, не собирая их все в памяти """
+    objs = iter(objs)
+    while batch := list(itertools.islice(objs, batch_size)):
+        model.objects.bulk_create(batch)
+
+
+def backfill_versions(apps, schema_editor):
+    """ Сохраняет текущее состояние существующих тендеров и предложений как их текущую версию """
+    Tenders = apps.get_model("tenders", "Tenders")
+    Bids = apps.get_model("tenders", "Bids")
+    TenderVersion = apps.get_model("tenders", "TenderVersion")
+    BidVersion = apps.get_model("tenders", "BidVersion")
+    _bulk_create_in_batches(TenderVersion, (
+        TenderVersion(tenderId_id=tender.tenderId, tenderName=tender.tenderName,
+                      tenderDescription=tender.tenderDescription, tenderServiceType=tender.tenderServiceType,
+                      tenderStatus=tender.tenderStatus, tenderVersion=tender.tenderVersion)
+        for tender in Tenders.objects.iterator(chunk_size=2000)
+    ))
+    _bulk_create_in_batches(BidVersion, (
+        BidVersion(bidId_id=bid.bidId, bidName=bid.bidName, bidDescription=bid.bidDescription,
+                   bidStatus=bid.bidStatus, bidDecision=bid.bidDecision, bidVersion=bid.bidVersion)
+        for bid in Bids.objects.iterator(chunk_size=2000)
+    ))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tenders', '0007_native_uuid_primary_keys'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TenderVersion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('tenderName', models.CharField(max_length=100)),
+                ('tenderDescription', models.TextField(max_length=500)),
+                ('tenderServiceType', models.CharField(choices=[('Construction', 'Строительство'), ('Delivery', 'Доставка'), ('Manufacture', 'Производство')], max_length=30)),
+                ('tenderStatus', models.CharField(choices=[('Created', 'Создан'), ('Published', 'Опубликован'), ('Closed', 'Закрыт')], max_length=30)),
+                ('tenderVersion', models.PositiveIntegerField(validators=[django.core.validators.MinValueValidator(limit_value=1)])),
+                ('savedAt', models.DateTimeField(auto_now_add=True)),
+                ('tenderId', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='versions', to='tenders.tenders')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='BidVersion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('bidName', models.CharField(max_length=100)),
+                ('bidDescription', models.TextField(max_length=500)),
+                ('bidStatus', models.CharField(choices=[('Created', 'Создано'), ('Published', 'Опубликовано'), ('Canceled', 'Закрыто')], max_length=30)),
+                ('bidDecision', models.CharField(choices=[('Approved', 'Одобрено'), ('Rejected', 'Отклонено')], max_length=30)),
+                ('bidVersion', models.PositiveIntegerField(validators=[django.core.validators.MinValueValidator(limit_value=1)])),
+                ('savedAt', models.DateTimeField(auto_now_add=True)),
+                ('bidId', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='versions', to='tenders.bids')),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='tenderversion',
+            constraint=models.UniqueConstraint(fields=('tenderId', 'tenderVersion'), name='tender_version_unique'),
+        ),
+        migrations.AddConstraint(
+            model_name='bidversion',
+            constraint=models.UniqueConstraint(fields=('bidId', 'bidVersion'), name='bid_version_unique'),
+        ),
+        migrations.RunPython(backfill_versions, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 4.2.5 on 2026-10-18 20:10
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tenders', '0008_version_history'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='tenders',
+            name='organizationId',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, to='tenders.organization'),
+        ),
+        migrations.CreateModel(
+            name='BidDecision',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('decision', models.CharField(choices=[('Approved', 'Одобрено'), ('Rejected', 'Отклонено')], max_length=30)),
+                ('createdAt', models.DateTimeField(auto_now=True)),
+                ('bidId', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='decisions', to='tenders.bids')),
+                ('responsibleId', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='tenders.employee')),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='biddecision',
+            constraint=models.UniqueConstraint(fields=('bidId', 'responsibleId'), name='bid_decision_unique'),
+        ),
+    ]
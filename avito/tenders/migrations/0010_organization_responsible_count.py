@@ -0,0 +1,30 @@
+# Generated by Django 4.2.5 on 2026-10-18 20:11
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def fill_responsible_count(apps, schema_editor):
+    """ Заполняет количество ответственных одним UPDATE по всем организациям """
+    Organization = apps.get_model("tenders", "Organization")
+    OrganizationResponsible = apps.get_model("tenders", "OrganizationResponsible")
+    counts = (OrganizationResponsible.objects.filter(organization_id=OuterRef("pk")).order_by()
+              .values("organization_id").annotate(count=Count("pk")).values("count"))
+    Organization.objects.update(responsible_count=Coalesce(Subquery(counts), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tenders', '0009_bid_decisions'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='organization',
+            name='responsible_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(fill_responsible_count, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,72 @@
+# Generated by Django 4.2.5 on 2026-10-18 21:02
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+# Конфигурация russian стеммит и русские слова, и латиницу (asciiword -> english_stem)
+SEARCH_CONFIG = "russian"
+
+SEARCH_VECTOR_TABLES = [
+    ("tenders_tenders", "tenderName", "tenderDescription"),
+    ("tenders_bids", "bidName", "bidDescription"),
+]
+
+
+def search_vector_sql(table: str, name: str, description: str) -> str:
+    """ Триггер пересчитывает searchVector при вставке и изменении названия или описания """
+    return f'''
+        CREATE FUNCTION "{table}_search_vector"() RETURNS trigger AS $$
+        BEGIN
+            NEW."searchVector" :=
+                setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(NEW."{name}", '')), 'A') ||
+                setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(NEW."{description}", '')), 'B');
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql;
+
+        CREATE TRIGGER "{table}_search_vector"
+            BEFORE INSERT OR UPDATE OF "{name}", "{description}" ON "{table}"
+            FOR EACH ROW EXECUTE FUNCTION "{table}_search_vector"();
+
+        UPDATE "{table}" SET "{name}" = "{name}";
+    '''
+
+
+def drop_search_vector_sql(table: str) -> str:
+    return f'''
+        DROP TRIGGER "{table}_search_vector" ON "{table}";
+        DROP FUNCTION "{table}_search_vector"();
+    '''
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tenders', '0010_organization_responsible_count'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='bids',
+            name='searchVector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='tenders',
+            name='searchVector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+    ] + [
+        migrations.RunSQL(sql=search_vector_sql(*columns), reverse_sql=drop_search_vector_sql(columns[0]))
+        for columns in SEARCH_VECTOR_TABLES
+    ] + [
+        migrations.AddIndex(
+            model_name='bids',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['searchVector'], name='bids_search_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tenders',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['searchVector'], name='tenders_search_idx'),
+        ),
+    ]
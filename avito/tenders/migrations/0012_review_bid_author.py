@@ -0,0 +1,36 @@
+# Generated by Django 4.2.5 on 2026-10-18 21:37
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def delete_unlinked_reviews(apps, schema_editor):
+    """ Отзывы без предложения нельзя связать ни с предложением, ни с автором, поэтому они удаляются """
+    apps.get_model("tenders", "Reviews").objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tenders', '0011_search_vector'),
+    ]
+
+    operations = [
+        migrations.RunPython(delete_unlinked_reviews, migrations.RunPython.noop),
+        migrations.AddField(
+            model_name='reviews',
+            name='authorId',
+            field=models.ForeignKey(db_index=False, default=None, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='tenders.employee'),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='reviews',
+            name='bidId',
+            field=models.ForeignKey(default=None, on_delete=django.db.models.deletion.CASCADE, related_name='reviews', to='tenders.bids'),
+            preserve_default=False,
+        ),
+        migrations.AddIndex(
+            model_name='reviews',
+            index=models.Index(fields=['authorId', 'createdAt', 'bidReviewId'], name='reviews_author_created_idx'),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 4.2.5 on 2026-10-18 21:14
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tenders', '0012_review_bid_author'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='bids',
+            name='bidAuthorId',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to='tenders.employee'),
+        ),
+        migrations.AlterField(
+            model_name='bids',
+            name='tenderId',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to='tenders.tenders'),
+        ),
+    ]
@@ -1,5 +1,7 @@
 import uuid
 
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.core.validators import MinValueValidator
 from django.db import models
 
@@ -18,20 +20,32 @@ class Tenders(models.Model):
         ("Manufacture", "Производство"),
     ]
 
-    tenderId = models.CharField(primary_key=True, default=uuid.uuid4())
+    tenderId = models.UUIDField(primary_key=True, default=uuid.uuid4)
     tenderName = models.CharField(max_length=100)
     tenderDescription = models.TextField(max_length=500)
     tenderServiceType = models.CharField(max_length=30, choices=TENDER_SERVICE_TYPE)
     tenderStatus = models.CharField(max_length=30, choices=TENDER_STATUS)
-    organizationId = models.CharField
+    organizationId = models.ForeignKey("Organization", on_delete=models.CASCADE, null=True)
     tenderVersion = models.PositiveIntegerField(default=1, validators=[MinValueValidator(limit_value=1)])
     creatorUsername = models.CharField(max_length=50)
     created_at = models.DateTimeField(auto_now_add=True)
+    # Заполняется триггером из tenderName и tenderDescription (миграция 0011_search_vector)
+    searchVector = SearchVectorField(null=True, editable=False)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["creatorUsername", "tenderName", "tenderId"], name="tenders_creator_name_id_idx"),
+            models.Index(fields=["tenderName", "tenderId"], name="tenders_published_name_idx",
+                         condition=models.Q(tenderStatus="Published")),
+            models.Index(fields=["tenderServiceType", "tenderName", "tenderId"], name="tenders_published_type_idx",
+                         condition=models.Q(tenderStatus="Published")),
+            GinIndex(fields=["searchVector"], name="tenders_search_idx"),
+        ]
 
 
 class Employee(models.Model):
     """ Класс для создания модели работника """
-    id = models.CharField(primary_key=True, default=uuid.uuid4())
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4)
     username = models.CharField(max_length=50, unique=True)
     first_name = models.CharField(max_length=50)
     last_name = models.CharField(max_length=50)
@@ -57,17 +71,26 @@ class Bids(models.Model):
         ("Rejected", "Отклонено")
     ]
 
-    bidId = models.CharField(primary_key=True, default=uuid.uuid4())
+    bidId = models.UUIDField(primary_key=True, default=uuid.uuid4)
     bidName = models.CharField(max_length=100)
     bidDescription = models.TextField(max_length=500)
     bidStatus = models.CharField(max_length=30, choices=BIDS_STATUS)
-    tenderId = models.ForeignKey(Tenders, on_delete=models.CASCADE)
+    tenderId = models.ForeignKey(Tenders, on_delete=models.CASCADE, db_index=False)
     organizationId = models.ForeignKey("Organization", on_delete=models.CASCADE)
     bidAuthorType = models.CharField(max_length=30, choices=BID_AUTHOR_TYPE)
-    bidAuthorId = models.ForeignKey(Employee, on_delete=models.CASCADE)
+    bidAuthorId = models.ForeignKey(Employee, on_delete=models.CASCADE, db_index=False)
     bidVersion = models.PositiveIntegerField(default=1, validators=[MinValueValidator(limit_value=1)])
     bidDecision = models.CharField(max_length=30, choices=BID_DECISION)
     createdAt = models.DateTimeField(auto_now_add=True)
+    # Заполняется триггером из bidName и bidDescription (миграция 0011_search_vector)
+    searchVector = SearchVectorField(null=True, editable=False)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["bidAuthorId", "bidName", "bidId"], name="bids_author_name_id_idx"),
+            models.Index(fields=["tenderId", "bidName", "bidId"], name="bids_tender_name_id_idx"),
+            GinIndex(fields=["searchVector"], name="bids_search_idx"),
+        ]
 
 
 class Organization(models.Model):
@@ -78,23 +101,77 @@ class Organization(models.Model):
         ('JSC', "Joint-stock company ")
     ]
 
-    id = models.CharField(primary_key=True, default=uuid.uuid4())
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4)
     name = models.CharField(max_length=100)
     description = models.TextField()
     type = models.CharField(max_length=30, choices=ORGANIZATION_TYPE)
+    responsible_count = models.PositiveIntegerField(default=0)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
 
 class OrganizationResponsible(models.Model):
     """ Класс для создания модели ответственного за организацию """
-    id = models.CharField(primary_key=True, default=uuid.uuid4())
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4)
     user_id = models.ForeignKey(Employee, on_delete=models.CASCADE)
     organization_id = models.ForeignKey(Organization, on_delete=models.CASCADE)
 
 
 class Reviews(models.Model):
     """ Класс для создания модели отзывов """
-    bidReviewId = models.CharField(primary_key=True, default=uuid.uuid4())
+    bidReviewId = models.UUIDField(primary_key=True, default=uuid.uuid4)
     bidReviewDescription = models.TextField(max_length=1000)
-    createdAt = models.DateTimeField(auto_now_add=True)
\ No newline at end of file
+    bidId = models.ForeignKey(Bids, on_delete=models.CASCADE, related_name="reviews")
+    # Автор предложения, копируется из Bids.bidAuthorId, чтобы отзывы автора читались по индексу без JOIN
+    authorId = models.ForeignKey(Employee, on_delete=models.CASCADE, related_name="+", db_index=False)
+    createdAt = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["authorId", "createdAt", "bidReviewId"], name="reviews_author_created_idx"),
+        ]
+
+
+class TenderVersion(models.Model):
+    """ Класс для создания модели сохраненной версии тендера """
+    tenderId = models.ForeignKey(Tenders, on_delete=models.CASCADE, related_name="versions", db_index=False)
+    tenderName = models.CharField(max_length=100)
+    tenderDescription = models.TextField(max_length=500)
+    tenderServiceType = models.CharField(max_length=30, choices=Tenders.TENDER_SERVICE_TYPE)
+    tenderStatus = models.CharField(max_length=30, choices=Tenders.TENDER_STATUS)
+    tenderVersion = models.PositiveIntegerField(validators=[MinValueValidator(limit_value=1)])
+    savedAt = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["tenderId", "tenderVersion"], name="tender_version_unique"),
+        ]
+
+
+class BidVersion(models.Model):
+    """ Класс для создания модели сохраненной версии предложения """
+    bidId = models.ForeignKey(Bids, on_delete=models.CASCADE, related_name="versions", db_index=False)
+    bidName = models.CharField(max_length=100)
+    bidDescription = models.TextField(max_length=500)
+    bidStatus = models.CharField(max_length=30, choices=Bids.BIDS_STATUS)
+    bidDecision = models.CharField(max_length=30, choices=Bids.BID_DECISION)
+    bidVersion = models.PositiveIntegerField(validators=[MinValueValidator(limit_value=1)])
+    savedAt = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["bidId", "bidVersion"], name="bid_version_unique"),
+        ]
+
+
+class BidDecision(models.Model):
+    """ Класс для создания модели решения ответственного по предложению """
+    bidId = models.ForeignKey(Bids, on_delete=models.CASCADE, related_name="decisions", db_index=False)
+    responsibleId = models.ForeignKey(Employee, on_delete=models.CASCADE)
+    decision = models.CharField(max_length=30, choices=Bids.BID_DECISION)
+    createdAt = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["bidId", "responsibleId"], name="bid_decision_unique"),
+        ]
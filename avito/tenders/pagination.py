@@ -1,11 +1,125 @@
-from rest_framework import pagination
+import base64
+import json
+from typing import Optional
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Q, QuerySet
+from rest_framework.exceptions import ValidationError
+from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.pagination import LimitOffsetPagination
 
 
+INVALID_CURSOR = {"reason": "Некорректный курсор пагинации."}
+
+
+def encode_cursor(values: list) -> str:
+    """ Функция для кодирования значений ключа сортировки в непрозрачный курсор """
+    raw = json.dumps([str(value) for value in values], separators=(",", ":"), ensure_ascii=False)
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> list:
+    """ Функция для декодирования курсора, возвращенного encode_cursor """
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except ValueError:
+        raise ValidationError(INVALID_CURSOR)
+    if not isinstance(values, list) or len(values) != size or not all(isinstance(v, str) for v in values):
+        raise ValidationError(INVALID_CURSOR)
+    return values
+
+
+def keyset_filter(queryset: QuerySet, fields: tuple, values: list) -> QuerySet:
+    """
+    Функция для выборки строк строго после (values) в порядке сортировки fields.
+    Условие field[0] >= value[0] ограничивает диапазон сканирования составного индекса
+    """
+    after = Q()
+    for i, field in enumerate(fields):
+        step = Q(**{f"{field}__gt": values[i]})
+        for prev_field, prev_value in zip(fields[:i], values[:i]):
+            step &= Q(**{prev_field: prev_value})
+        after |= step
+    return queryset.filter(**{f"{fields[0]}__gte": values[0]}).filter(after)
+
+
 class CustomPagination(LimitOffsetPagination):
-    """ Класс для создания пагинации """
+    """
+    Класс для создания пагинации.
+    По умолчанию limit/offset без подсчета общего числа строк.
+    С параметром cursor (пустым для первой страницы) включается пагинация по ключу сортировки
+    запроса, а курсор следующей страницы возвращается в заголовке X-Next-Cursor
+    """
+    max_limit = 50
+    cursor_query_param = "cursor"
+    cursor_header = "X-Next-Cursor"
+
+    def paginate_queryset(self, queryset: QuerySet, request: Request, view=None) -> Optional[list]:
+        """ Функция для получения строк текущей страницы """
+        page = self.get_page_queryset(queryset, request)
+        if page is None:
+            return None
+        return self.get_page_rows(page, list(page))
+
+    async def apaginate_queryset(self, queryset: QuerySet, request: Request) -> Optional[list]:
+        """ Функция для получения строк текущей страницы через асинхронный ORM """
+        page = self.get_page_queryset(queryset, request)
+        if page is None:
+            return None
+        return self.get_page_rows(page, [row async for row in page])
+
+    def get_page_queryset(self, queryset: QuerySet, request: Request) -> Optional[QuerySet]:
+        """
+        Функция для получения запроса страницы без его выполнения.
+        По курсору выбирается на одну строку больше, чтобы узнать, есть ли следующая страница
+        """
+        self.request = request
+        self.next_cursor = None
+        self.cursor_fields = None
+        self.limit = self.get_limit(request)
+        if self.limit is None:
+            return None
+        if self.cursor_query_param in request.query_params:
+            return self.get_cursor_queryset(queryset, request.query_params[self.cursor_query_param])
+        self.offset = self.get_offset(request)
+        return queryset[self.offset:self.offset + self.limit]
+
+    def get_cursor_queryset(self, queryset: QuerySet, cursor: str) -> QuerySet:
+        """ Функция для получения запроса страницы после курсора, стоимость не зависит от номера страницы """
+        fields = tuple(queryset.query.order_by)
+        if not fields or any(field.startswith("-") for field in fields):
+            raise ValidationError({"reason": "Пагинация по курсору недоступна для этой сортировки."})
+        if cursor:
+            # Значения курсора приводятся к типам полей при построении фильтра: подмененный курсор
+            # с некорректным UUID или числом - ошибка запроса, а не сервера
+            try:
+                queryset = keyset_filter(queryset, fields, decode_cursor(cursor, len(fields)))
+            except (ValueError, TypeError, DjangoValidationError):
+                raise ValidationError(INVALID_CURSOR)
+        self.cursor_fields = fields
+        return queryset[:self.limit + 1]
+
+    def get_page_rows(self, page: QuerySet, rows: list) -> list:
+        """ Функция для обрезки лишней строки и расчета курсора следующей страницы """
+        if self.cursor_fields is not None and len(rows) > self.limit:
+            rows = rows[:self.limit]
+            self.next_cursor = encode_cursor(self.get_row_values(page, rows[-1], self.cursor_fields))
+        return rows
+
+    @staticmethod
+    def get_row_values(queryset: QuerySet, row, fields: tuple) -> list:
+        """ Функция для получения значений ключа сортировки из объекта, словаря или кортежа values_list """
+        if isinstance(row, dict):
+            return [row[field] for field in fields]
+        if isinstance(row, tuple):
+            columns = queryset.query.values_select
+            return [row[columns.index(field)] for field in fields]
+        return [getattr(row, field) for field in fields]
 
     def get_paginated_response(self, data: dict) -> Response:
         """ Функция для получения пагинации """
-        return Response(data)
+        response = Response(data)
+        if self.next_cursor is not None:
+            response[self.cursor_header] = self.next_cursor
+        return response
@@ -0,0 +1,78 @@
+import csv
+import io
+from typing import Any, Optional
+
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+ORJSON_OPTIONS = (orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS) if orjson is not None else 0
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    Класс для рендеринга JSON через orjson.
+    UUID и datetime сериализуются в orjson без Python-кода, остальные типы отдаются JSONEncoder из DRF.
+    Вывод совпадает с JSONRenderer: компактный, без экранирования не-ASCII, UTC как Z.
+    С отступами и без установленного orjson работает JSONRenderer
+    """
+    default = JSONEncoder().default
+
+    def render(self, data: Any, accepted_media_type: Optional[str] = None, renderer_context: dict = None) -> bytes:
+        if data is None:
+            return b""
+        if orjson is None or self.get_indent(accepted_media_type or "", renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+        ret = orjson.dumps(data, default=self.default, option=ORJSON_OPTIONS)
+        # Как и JSONRenderer, экранируем U+2028 и U+2029, которые ломают JavaScript
+        if b"\xe2\x80\xa8" in ret or b"\xe2\x80\xa9" in ret:
+            ret = ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
+        return ret
+
+
+class PrometheusRenderer(BaseRenderer):
+    """ Класс для вывода уже подготовленного текста метрик в формате Prometheus """
+    media_type = "text/plain"
+    format = "txt"
+    charset = "utf-8"
+
+    def render(self, data: Any, accepted_media_type: Optional[str] = None, renderer_context: dict = None) -> bytes:
+        return data.encode(self.charset)
+
+
+class NDJSONRenderer(BaseRenderer):
+    """ Класс для вывода списка строк в формате NDJSON: по одному JSON-объекту на строку """
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+    charset = "utf-8"
+    json_renderer = FastJSONRenderer()
+
+    def render(self, data: Any, accepted_media_type: Optional[str] = None, renderer_context: dict = None) -> bytes:
+        rows = data if isinstance(data, list) else [data]
+        return b"".join(self.json_renderer.render(row) + b"\n" for row in rows)
+
+
+class CSVRenderer(BaseRenderer):
+    """
+    Класс для вывода списка строк в формате CSV.
+    Заголовок берется из renderer_context["fields"] или ключей первой строки,
+    при потоковой выгрузке он выводится только с первой пачкой (renderer_context["header"])
+    """
+    media_type = "text/csv"
+    format = "csv"
+    charset = "utf-8"
+
+    def render(self, data: Any, accepted_media_type: Optional[str] = None, renderer_context: dict = None) -> bytes:
+        rows = data if isinstance(data, list) else [data]
+        context = renderer_context or {}
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        fields = context.get("fields") or (list(rows[0]) if rows else [])
+        if context.get("header", True) and fields:
+            writer.writerow(fields)
+        writer.writerows(row.values() for row in rows)
+        return buffer.getvalue().encode(self.charset)
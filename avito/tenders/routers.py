@@ -0,0 +1,86 @@
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterable, Iterator, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections
+
+REPLICA_PREFIX = "replica"
+STICKY_CACHE_PREFIX = "primary-sticky:"
+
+_primary_required: ContextVar[bool] = ContextVar("primary_required", default=False)
+
+
+@contextmanager
+def use_primary(required: bool = True) -> Iterator[None]:
+    """ Контекстный менеджер, внутри которого все чтения идут в основную базу """
+    token = _primary_required.set(required)
+    try:
+        yield
+    finally:
+        _primary_required.reset(token)
+
+
+def primary_required() -> bool:
+    """ Функция для проверки, должны ли чтения в текущем контексте идти в основную базу """
+    return _primary_required.get()
+
+
+def pin_to_primary(usernames: Iterable[str]) -> None:
+    """
+    Функция для закрепления пользователей за основной базой после записи на REPLICA_STICKY_SECONDS,
+    чтобы реплика с задержкой не вернула им данные до их же изменения. Хранится в кэше Django,
+    поэтому работает между процессами, если кэш общий
+    """
+    seconds = getattr(settings, "REPLICA_STICKY_SECONDS", 5)
+    keys = {f"{STICKY_CACHE_PREFIX}{username}": True for username in usernames if username}
+    if keys and seconds > 0:
+        cache.set_many(keys, timeout=seconds)
+
+
+async def apin_to_primary(usernames: Iterable[str]) -> None:
+    """ Функция для закрепления пользователей за основной базой в async-коде, работает как pin_to_primary """
+    seconds = getattr(settings, "REPLICA_STICKY_SECONDS", 5)
+    keys = {f"{STICKY_CACHE_PREFIX}{username}": True for username in usernames if username}
+    if keys and seconds > 0:
+        await cache.aset_many(keys, timeout=seconds)
+
+
+def is_pinned_to_primary(usernames: Iterable[str]) -> bool:
+    """ Функция для проверки, закреплен ли кто-то из пользователей за основной базой """
+    keys = [f"{STICKY_CACHE_PREFIX}{username}" for username in usernames if username]
+    return bool(keys) and bool(cache.get_many(keys))
+
+
+async def ais_pinned_to_primary(usernames: Iterable[str]) -> bool:
+    """ Функция для проверки закрепления в async-коде, работает как is_pinned_to_primary """
+    keys = [f"{STICKY_CACHE_PREFIX}{username}" for username in usernames if username]
+    return bool(keys) and bool(await cache.aget_many(keys))
+
+
+class ReplicaRouter:
+    """
+    Класс для распределения чтений по репликам (алиасы DATABASES, начинающиеся с replica).
+    Записи, чтения внутри транзакции и чтения в контексте use_primary идут в основную базу
+    """
+
+    def __init__(self, replicas: Optional[list] = None) -> None:
+        if replicas is None:
+            replicas = [alias for alias in settings.DATABASES if alias.startswith(REPLICA_PREFIX)]
+        self.replicas = replicas
+
+    def db_for_read(self, model, **hints) -> str:
+        if not self.replicas or primary_required() or connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return DEFAULT_DB_ALIAS
+        return random.choice(self.replicas)
+
+    def db_for_write(self, model, **hints) -> str:
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints) -> bool:
+        return True
+
+    def allow_migrate(self, db: str, app_label: str, **hints) -> bool:
+        return db == DEFAULT_DB_ALIAS
@@ -0,0 +1,24 @@
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db.models import F, QuerySet
+
+# Должна совпадать с конфигурацией триггеров searchVector (миграция 0011_search_vector)
+SEARCH_CONFIG = "russian"
+SEARCH_PARAM = "search"
+
+
+def search(queryset: QuerySet, text: str) -> QuerySet:
+    """
+    Функция для полнотекстового поиска по названию и описанию.
+    Условие searchVector @@ запрос выполняется по GIN-индексу, строки сортируются по релевантности
+    (совпадение в названии весит больше, чем в описании), при равной релевантности - в исходном порядке списка
+    """
+    query = SearchQuery(text, config=SEARCH_CONFIG, search_type="websearch")
+    return (queryset.filter(searchVector=query)
+            .annotate(rank=SearchRank(F("searchVector"), query))
+            .order_by("-rank", *queryset.query.order_by))
+
+
+def search_from_params(queryset: QuerySet, query_params) -> QuerySet:
+    """ Функция для применения параметра search из запроса, без него запрос не меняется """
+    text = query_params.get(SEARCH_PARAM, "").strip()
+    return search(queryset, text) if text else queryset
@@ -1,10 +1,96 @@
+import time
+from datetime import datetime
+from functools import lru_cache
+from operator import attrgetter
+from typing import Callable, Iterable
+
+from django.db.models import Model, QuerySet
 from rest_framework import serializers
 
 from .models import Tenders
 
+TIMESTAMP_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
+
 
-class TenderSerializer(serializers):
+class TenderSerializer(serializers.ModelSerializer):
     class Meta:
         model = Tenders
         fields = ["tenderId", "tenderName", "tenderDescription", "tenderServiceType", "tenderStatus",
-                  "tenderVersion", "created_at"]
\ No newline at end of file
+                  "tenderVersion", "created_at"]
+
+
+@lru_cache(maxsize=8192)
+def _format_second(second: int) -> str:
+    """ Функция для форматирования секунды от начала эпохи, результат кэшируется """
+    return time.strftime(TIMESTAMP_FORMAT, time.gmtime(second))
+
+
+def format_timestamp(value: datetime) -> str:
+    """ Функция для форматирования даты в UTC с точностью до секунды """
+    if value.tzinfo is None:
+        return value.strftime(TIMESTAMP_FORMAT)
+    return _format_second(int(value.timestamp()))
+
+
+class FastSerializer:
+    """
+    Класс для сериализации строк values_list() в словари ответа без DRF.
+    Поля задаются как ключ ответа -> колонка модели, по ним один раз собирается функция,
+    которая строит словарь литералом, поэтому на строку нет вызовов на каждое поле
+    """
+
+    def __init__(self, timestamps: Iterable[str] = (), **fields: str) -> None:
+        self.keys = tuple(fields)
+        self.columns = tuple(fields.values())
+        self.timestamps = frozenset(timestamps)
+        self.get_columns = attrgetter(*self.columns)
+        self.serialize_rows = self.compile()
+
+    def compile(self) -> Callable[[Iterable[tuple]], list]:
+        """ Функция для сборки сериализатора списка строк """
+        items = ", ".join(
+            f"{key!r}: format_timestamp(row[{i}])" if key in self.timestamps else f"{key!r}: row[{i}]"
+            for i, key in enumerate(self.keys)
+        )
+        namespace = {"format_timestamp": format_timestamp}
+        exec(f"def serialize_rows(rows):\n    return [{{{items}}} for row in rows]", namespace)
+        return namespace["serialize_rows"]
+
+    def rows(self, queryset: QuerySet) -> QuerySet:
+        """ Функция для выборки только нужных колонок в виде кортежей """
+        return queryset.values_list(*self.columns)
+
+    def serialize(self, instance: Model) -> dict:
+        """ Функция для сериализации одного объекта модели """
+        row = self.get_columns(instance)
+        return self.serialize_rows([row if len(self.columns) > 1 else (row,)])[0]
+
+
+tender_serializer = FastSerializer(
+    timestamps=["createdAt"],
+    id="tenderId", name="tenderName", description="tenderDescription", status="tenderStatus",
+    serviceType="tenderServiceType", version="tenderVersion", createdAt="created_at",
+)
+
+tender_version_serializer = FastSerializer(
+    timestamps=["savedAt"],
+    id="tenderId_id", name="tenderName", description="tenderDescription", status="tenderStatus",
+    serviceType="tenderServiceType", version="tenderVersion", savedAt="savedAt",
+)
+
+bid_serializer = FastSerializer(
+    timestamps=["createdAt"],
+    id="bidId", name="bidName", status="bidStatus", authorType="bidAuthorType", authorId="bidAuthorId_id",
+    version="bidVersion", createdAt="createdAt",
+)
+
+bid_version_serializer = FastSerializer(
+    timestamps=["savedAt"],
+    id="bidId_id", name="bidName", description="bidDescription", status="bidStatus", decision="bidDecision",
+    version="bidVersion", savedAt="savedAt",
+)
+
+review_serializer = FastSerializer(
+    timestamps=["createdAt"],
+    id="bidReviewId", description="bidReviewDescription", createdAt="createdAt",
+)
@@ -0,0 +1,95 @@
+import uuid
+from typing import Optional
+
+from django.core.signals import request_started
+from django.db import transaction
+from django.db.backends.signals import connection_created
+from django.db.models import F
+from django.db.models.functions import Greatest
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .cache import identity_cache
+from .db_metrics import connection_stats
+from .metrics import install_query_wrapper
+from .models import Employee, Organization, OrganizationResponsible
+
+
+def _invalidate(employee_id: uuid.UUID, username: Optional[str] = None) -> None:
+    """
+    Функция для сброса пользователя в кэше.
+    Повторяется после коммита, чтобы не осталась запись, прочитанная до фиксации транзакции
+    """
+    def invalidate() -> None:
+        identity_cache.invalidate_id(employee_id)
+        if username is not None:
+            identity_cache.invalidate(username)
+
+    invalidate()
+    transaction.on_commit(invalidate)
+
+
+@receiver([post_save, post_delete], sender=Employee)
+def invalidate_employee(sender, instance: Employee, **kwargs) -> None:
+    """ Функция для сброса кэша пользователя при его изменении или удалении """
+    _invalidate(instance.pk, instance.username)
+
+
+@receiver([post_save, post_delete], sender=OrganizationResponsible)
+def invalidate_responsible(sender, instance: OrganizationResponsible, **kwargs) -> None:
+    """
+    Функция для сброса кэша пользователя при изменении его организаций.
+    Если запись передали другому пользователю, сбрасывается и прежний, иначе у него останется организация
+    """
+    _invalidate(instance.user_id_id)
+    previous = getattr(instance, "_previous_user_id", None)
+    if previous is not None and previous != instance.user_id_id:
+        _invalidate(previous)
+
+
+def _shift_responsible_count(organization_id: Optional[uuid.UUID], delta: int) -> None:
+    """ Функция для изменения счетчика ответственных организации одним UPDATE """
+    if organization_id is not None:
+        Organization.objects.filter(id=organization_id).update(
+            responsible_count=Greatest(F("responsible_count") + delta, 0)
+        )
+
+
+@receiver(pre_save, sender=OrganizationResponsible)
+def remember_previous_responsible(sender, instance: OrganizationResponsible, **kwargs) -> None:
+    """ Функция для запоминания прежних организации и пользователя ответственного перед изменением одним запросом """
+    previous = None
+    if not instance._state.adding:
+        previous = (OrganizationResponsible.objects.filter(pk=instance.pk)
+                    .values_list("organization_id", "user_id").first())
+    instance._previous_organization_id, instance._previous_user_id = previous or (None, None)
+
+
+@receiver(post_save, sender=OrganizationResponsible)
+def count_saved_responsible(sender, instance: OrganizationResponsible, created: bool, **kwargs) -> None:
+    """ Функция для обновления счетчиков ответственных при добавлении или переводе в другую организацию """
+    previous = getattr(instance, "_previous_organization_id", None)
+    if created:
+        _shift_responsible_count(instance.organization_id_id, 1)
+    elif previous is not None and previous != instance.organization_id_id:
+        _shift_responsible_count(previous, -1)
+        _shift_responsible_count(instance.organization_id_id, 1)
+
+
+@receiver(post_delete, sender=OrganizationResponsible)
+def count_deleted_responsible(sender, instance: OrganizationResponsible, **kwargs) -> None:
+    """ Функция для уменьшения счетчика ответственных при удалении """
+    _shift_responsible_count(instance.organization_id_id, -1)
+
+
+@receiver(connection_created)
+def count_connection(sender, connection, **kwargs) -> None:
+    """ Функция для подсчета новых соединений с базой и установки счетчика SQL-запросов для метрик маршрутов """
+    connection_stats.connection_opened()
+    install_query_wrapper(connection)
+
+
+@receiver(request_started)
+def count_request(sender, **kwargs) -> None:
+    """ Функция для подсчета запросов, чтобы сравнить их число с числом новых соединений """
+    connection_stats.request_started()
@@ -0,0 +1,240 @@
+import hashlib
+import math
+import uuid
+from itertools import islice
+from typing import Callable, Iterable, Iterator, Optional, Type
+
+from django.db import DEFAULT_DB_ALIAS, connections, models, transaction
+from django.db.backends.postgresql.psycopg_any import is_psycopg3
+
+from .cache import tender_list_cache
+from .models import Bids, BidVersion, Employee, Organization, OrganizationResponsible, Reviews, Tenders, \
+    TenderVersion
+
+WORDS = [
+    "поставка", "бетона", "ремонт", "кровли", "доставка", "оборудования", "производство", "мебели",
+    "строительство", "склада", "монтаж", "вентиляции", "перевозка", "грузов", "изготовление", "деталей",
+    "укладка", "асфальта", "обслуживание", "серверов", "закупка", "металлопроката", "покраска", "фасада",
+]
+ORGANIZATION_TYPES = [choice for choice, _ in Organization.ORGANIZATION_TYPE]
+SERVICE_TYPES = [choice for choice, _ in Tenders.TENDER_SERVICE_TYPE]
+# Доли статусов в процентах: большая часть тендеров и предложений опубликована
+TENDER_STATUSES = [("Created", 10), ("Published", 70), ("Closed", 20)]
+BID_STATUSES = [("Created", 20), ("Published", 65), ("Canceled", 15)]
+BID_DECISIONS = [("", 85), ("Approved", 5), ("Rejected", 10)]
+
+
+class SyntheticDataset:
+    """
+    Класс для генерации воспроизводимого набора данных для нагрузочных замеров.
+    Каждое значение строки вычисляется из (seed, prefix, вид объекта, номер строки), поэтому генерация
+    не хранит уже созданные строки и занимает постоянную память при любом числе строк.
+    Связи распределены неравномерно: небольшая часть организаций, тендеров и авторов получает
+    большую часть тендеров, предложений и отзывов, как в реальных данных
+    """
+
+    def __init__(self, organizations: int, employees: int, responsibles: int, tenders: int, bids: int,
+                 reviews: int, seed: int = 0, prefix: str = "load", skew: float = 2.0) -> None:
+        if not 0 < organizations <= responsibles <= employees:
+            raise ValueError("Нужно 0 < organizations <= responsibles <= employees")
+        if bids and not tenders or reviews and not bids:
+            raise ValueError("Для предложений нужны тендеры, для отзывов - предложения")
+        self.organizations = organizations
+        self.employees = employees
+        self.responsibles = responsibles
+        self.tenders = tenders
+        self.bids = bids
+        self.reviews = reviews
+        self.seed = seed
+        self.prefix = prefix
+        self.skew = skew
+
+    def _digest(self, kind: str, index: int, size: int) -> bytes:
+        """ Функция для псевдослучайных байтов, зависящих только от вида объекта и номера строки """
+        return hashlib.blake2b(f"{self.seed}:{self.prefix}:{kind}:{index}".encode(), digest_size=size).digest()
+
+    def _fraction(self, kind: str, index: int) -> float:
+        """ Функция для псевдослучайного числа из [0, 1) """
+        return int.from_bytes(self._digest(kind, index, 8), "big") / 2 ** 64
+
+    def _pick(self, kind: str, index: int, count: int) -> int:
+        """ Функция для выбора номера из count со смещением к малым номерам (степенное распределение) """
+        return min(int(count * self._fraction(kind, index) ** self.skew), count - 1)
+
+    def _choice(self, kind: str, index: int, weighted: list) -> str:
+        """ Функция для выбора значения по долям в процентах """
+        point = self._fraction(kind, index) * 100
+        for value, weight in weighted:
+            point -= weight
+            if point < 0:
+                return value
+        return weighted[-1][0]
+
+    def _text(self, kind: str, index: int, words: int) -> str:
+        """ Функция для текста из words слов, чтобы поисковые векторы строк различались """
+        bits = int.from_bytes(self._digest(kind, index, 32), "big")
+        chosen = []
+        for _ in range(words):
+            bits, word = divmod(bits, len(WORDS))
+            chosen.append(WORDS[word])
+        return " ".join(chosen)
+
+    def _uuid(self, kind: str, index: int) -> uuid.UUID:
+        """ Функция для первичного ключа строки: связи вычисляются без чтения уже вставленных строк """
+        return uuid.UUID(bytes=self._digest(kind, index, 16), version=4)
+
+    def organization_id(self, index: int) -> uuid.UUID:
+        return self._uuid("organization", index)
+
+    def employee_id(self, index: int) -> uuid.UUID:
+        return self._uuid("employee", index)
+
+    def tender_id(self, index: int) -> uuid.UUID:
+        return self._uuid("tender", index)
+
+    def bid_id(self, index: int) -> uuid.UUID:
+        return self._uuid("bid", index)
+
+    def username(self, index: int) -> str:
+        return f"{self.prefix}-user-{index}"
+
+    def responsible_count(self, organization: int) -> int:
+        """ Ответственный с номером i отвечает за организацию i % organizations """
+        return math.ceil((self.responsibles - organization) / self.organizations)
+
+    def responsible(self, organization: int, kind: str, index: int) -> int:
+        """ Функция для выбора номера ответственного за организацию """
+        offset = int(self._fraction(kind, index) * self.responsible_count(organization))
+        return organization + self.organizations * offset
+
+    def tender_organization(self, index: int) -> int:
+        return self._pick("tender-organization", index, self.organizations)
+
+    def bid_tender(self, index: int) -> int:
+        return self._pick("bid-tender", index, self.tenders)
+
+    def bid_author(self, index: int) -> int:
+        return self._pick("bid-author", index, self.responsibles)
+
+    def review_bid(self, index: int) -> int:
+        return self._pick("review-bid", index, self.bids)
+
+    def iter_organizations(self) -> Iterator[Organization]:
+        for i in range(self.organizations):
+            yield Organization(id=self.organization_id(i), name=f"Организация {self.prefix} {i}",
+                               description=self._text("organization", i, 6),
+                               type=ORGANIZATION_TYPES[i % len(ORGANIZATION_TYPES)],
+                               responsible_count=self.responsible_count(i))
+
+    def iter_employees(self) -> Iterator[Employee]:
+        for i in range(self.employees):
+            yield Employee(id=self.employee_id(i), username=self.username(i), first_name="Имя", last_name="Фамилия")
+
+    def iter_responsibles(self) -> Iterator[OrganizationResponsible]:
+        for i in range(self.responsibles):
+            yield OrganizationResponsible(id=self._uuid("responsible", i), user_id_id=self.employee_id(i),
+                                          organization_id_id=self.organization_id(i % self.organizations))
+
+    def iter_tenders(self) -> Iterator[Tenders]:
+        for i in range(self.tenders):
+            organization = self.tender_organization(i)
+            yield Tenders(
+                tenderId=self.tender_id(i),
+                tenderName=f"{self._text('tender-name', i, 2).capitalize()} №{i}",
+                tenderDescription=self._text("tender-description", i, 12),
+                tenderServiceType=SERVICE_TYPES[int(self._fraction("tender-type", i) * len(SERVICE_TYPES))],
+                tenderStatus=self._choice("tender-status", i, TENDER_STATUSES),
+                organizationId_id=self.organization_id(organization),
+                creatorUsername=self.username(self.responsible(organization, "tender-creator", i)),
+            )
+
+    def iter_bids(self) -> Iterator[Bids]:
+        for i in range(self.bids):
+            author = self.bid_author(i)
+            status = self._choice("bid-status", i, BID_STATUSES)
+            yield Bids(
+                bidId=self.bid_id(i),
+                bidName=f"{self._text('bid-name', i, 2).capitalize()} №{i}",
+                bidDescription=self._text("bid-description", i, 12),
+                bidStatus=status,
+                tenderId_id=self.tender_id(self.bid_tender(i)),
+                organizationId_id=self.organization_id(author % self.organizations),
+                bidAuthorType="User",
+                bidAuthorId_id=self.employee_id(author),
+                bidDecision=self._choice("bid-decision", i, BID_DECISIONS) if status == "Published" else "",
+            )
+
+    def iter_reviews(self) -> Iterator[Reviews]:
+        for i in range(self.reviews):
+            bid = self.review_bid(i)
+            yield Reviews(bidReviewId=self._uuid("review", i), bidReviewDescription=self._text("review", i, 8),
+                          bidId_id=self.bid_id(bid), authorId_id=self.employee_id(self.bid_author(bid)))
+
+    def generate(self, batch: int = 5000, progress: Optional[Callable[[str, int], None]] = None) -> dict:
+        """
+        Функция для вставки набора пачками по batch строк через insert_rows, каждая пачка в своей транзакции.
+        Для тендеров и предложений сразу сохраняется первая версия, как при создании через API.
+        Возвращает количество вставленных строк по таблицам
+        """
+        tables = [
+            (Organization, self.iter_organizations(), None, None),
+            (Employee, self.iter_employees(), None, None),
+            (OrganizationResponsible, self.iter_responsibles(), None, None),
+            (Tenders, self.iter_tenders(), TenderVersion, tender_version),
+            (Bids, self.iter_bids(), BidVersion, bid_version),
+            (Reviews, self.iter_reviews(), None, None),
+        ]
+        counts = {}
+        for model, rows, version_model, version in tables:
+            inserted = 0
+            for chunk in chunks(rows, batch):
+                with transaction.atomic():
+                    insert_rows(model, chunk)
+                    if version is not None:
+                        insert_rows(version_model, [version(row) for row in chunk])
+                inserted += len(chunk)
+                if progress is not None:
+                    progress(model._meta.db_table, inserted)
+            counts[model._meta.db_table] = inserted
+        tender_list_cache.bump_generation()
+        return counts
+
+
+def insert_rows(model: Type[models.Model], rows: list) -> None:
+    """
+    Функция для вставки пачки строк командой COPY: bulk_create при psycopg 3 тратит большую часть времени
+    на разбор многострочного INSERT на клиенте, а COPY передает строки потоком.
+    Значения готовятся так же, как в bulk_create (pre_save заполняет auto_now_add), триггеры срабатывают как при INSERT
+    """
+    if not is_psycopg3:
+        model.objects.bulk_create(rows)
+        return
+    # Соединение берется один раз: прокси django.db.connection обращается к asgiref.Local на каждое поле
+    db = connections[DEFAULT_DB_ALIAS]
+    fields = [field for field in model._meta.concrete_fields if not isinstance(field, models.AutoField)]
+    columns = ", ".join(db.ops.quote_name(field.column) for field in fields)
+    sql = f"COPY {db.ops.quote_name(model._meta.db_table)} ({columns}) FROM STDIN"
+    prepare = [(field.pre_save, field.get_db_prep_save) for field in fields]
+    with db.cursor() as cursor, cursor.cursor.copy(sql) as copy:
+        for row in rows:
+            copy.write_row([prep_save(pre_save(row, True), db) for pre_save, prep_save in prepare])
+
+
+def tender_version(tender: Tenders) -> TenderVersion:
+    """ Функция для первой версии тендера, как в bulk_create_tenders """
+    return TenderVersion(tenderId_id=tender.tenderId, tenderName=tender.tenderName,
+                         tenderDescription=tender.tenderDescription, tenderServiceType=tender.tenderServiceType,
+                         tenderStatus=tender.tenderStatus, tenderVersion=tender.tenderVersion)
+
+
+def bid_version(bid: Bids) -> BidVersion:
+    """ Функция для первой версии предложения, как в bulk_create_bids """
+    return BidVersion(bidId_id=bid.bidId, bidName=bid.bidName, bidDescription=bid.bidDescription,
+                      bidStatus=bid.bidStatus, bidDecision=bid.bidDecision, bidVersion=bid.bidVersion)
+
+
+def chunks(rows: Iterable, size: int) -> Iterator[list]:
+    """ Функция для разбиения потока строк на списки по size штук """
+    rows = iter(rows)
+    while chunk := list(islice(rows, size)):
+        yield chunk
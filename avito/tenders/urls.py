@@ -1,27 +1,39 @@
-from django.urls import path
+from django.urls import path, re_path
 
 from .views import TendersAPIView, PingAPIView, TendersNewAPIView, TendersStatusAPIView,\
     TendersEditAPIView, TendersRollbackVersionAPIView, UserTendersListAPIView, BidsNewAPIView,\
     BidsMyAPIView, BidsTendersListAPIView, BidsStatusAPIView, BidsEditAPIView, BidsDecisionAPIView, \
-    BidsFeedbackAPIView, BidsRollbackAPIView, BidsReviewsAPIView
+    BidsFeedbackAPIView, BidsRollbackAPIView, BidsReviewsAPIView, TendersHistoryAPIView, BidsHistoryAPIView, \
+    TendersBulkAPIView, BidsBulkAPIView, DatabaseMetricsAPIView, CacheMetricsAPIView, TendersExportAPIView, \
+    BidsExportAPIView, api_not_found
 
 urlpatterns = [
     path("ping", PingAPIView.as_view(), name="ping"),
+    path("metrics/db", DatabaseMetricsAPIView.as_view(), name="metrics_db"),
+    path("metrics/cache", CacheMetricsAPIView.as_view(), name="metrics_cache"),
     path("tenders", TendersAPIView.as_view(), name="tenders"),
+    path("tenders/export", TendersExportAPIView.as_view(), name="tenders_export"),
     path("tenders/new", TendersNewAPIView.as_view(), name="tenders_new"),
-    path("tenders/<str:tenderId>/status", TendersStatusAPIView.as_view(), name="tenders_status"),
-    path("tenders/<str:tenderId>/edit", TendersEditAPIView.as_view(), name="tenders_edit"),
-    path("tenders/<str:tenderId>/rollback/<int:version>", TendersRollbackVersionAPIView.as_view(), name="tenders_rollback"),
+    path("tenders/bulk", TendersBulkAPIView.as_view(), name="tenders_bulk"),
+    path("tenders/<uuid:tenderId>/status", TendersStatusAPIView.as_view(), name="tenders_status"),
+    path("tenders/<uuid:tenderId>/edit", TendersEditAPIView.as_view(), name="tenders_edit"),
+    path("tenders/<uuid:tenderId>/rollback/<int:version>", TendersRollbackVersionAPIView.as_view(), name="tenders_rollback"),
+    path("tenders/<uuid:tenderId>/history", TendersHistoryAPIView.as_view(), name="tenders_history"),
     path("tenders/my", UserTendersListAPIView.as_view(), name="tenders_my"),
 
     path("bids/new", BidsNewAPIView.as_view(), name="bids_new"),
+    path("bids/bulk", BidsBulkAPIView.as_view(), name="bids_bulk"),
     path("bids/my", BidsMyAPIView.as_view(), name="bids_my"),
-    path("bids/<str:tenderId>/list", BidsTendersListAPIView.as_view(), name="bids_list"),
-    path("bids/<str:bidId>/status", BidsStatusAPIView.as_view(), name="bids_status"),
-    path("bids/<str:bidId>/edit", BidsEditAPIView.as_view(), name="bids_edit"),
-    path("bids/<str:bidId>/submit_decision", BidsDecisionAPIView.as_view(), name="bids_decision"),
-    path("bids/<str:bidId>/feedback", BidsFeedbackAPIView.as_view(), name="bids_feedback"),
-    path("bids/<str:bidId>/rollback/<int:version>", BidsRollbackAPIView.as_view(), name="bids_rollback"),
-    path("bids/<str:tenderId>/reviews", BidsReviewsAPIView.as_view(), name="bids_reviews"),
+    path("bids/<uuid:tenderId>/list", BidsTendersListAPIView.as_view(), name="bids_list"),
+    path("bids/<uuid:tenderId>/export", BidsExportAPIView.as_view(), name="bids_export"),
+    path("bids/<uuid:bidId>/status", BidsStatusAPIView.as_view(), name="bids_status"),
+    path("bids/<uuid:bidId>/edit", BidsEditAPIView.as_view(), name="bids_edit"),
+    path("bids/<uuid:bidId>/submit_decision", BidsDecisionAPIView.as_view(), name="bids_decision"),
+    path("bids/<uuid:bidId>/feedback", BidsFeedbackAPIView.as_view(), name="bids_feedback"),
+    path("bids/<uuid:bidId>/rollback/<int:version>", BidsRollbackAPIView.as_view(), name="bids_rollback"),
+    path("bids/<uuid:bidId>/history", BidsHistoryAPIView.as_view(), name="bids_history"),
+    path("bids/<uuid:tenderId>/reviews", BidsReviewsAPIView.as_view(), name="bids_reviews"),
 
+    # Последним: неизвестные адреса и некорректные UUID получают JSON 404, а не HTML-страницу Django
+    re_path(r"", api_not_found),
 ]
\ No newline at end of file
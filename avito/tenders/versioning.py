@@ -0,0 +1,106 @@
+from django.db import transaction
+from django.db.models import F
+
+from .cache import tender_list_cache
+from .models import Tenders, Bids, TenderVersion, BidVersion
+
+
+class VersionConflict(Exception):
+    """ Исключение, когда объект уже изменили после того, как его прочитали """
+
+
+def save_tender_version(tender: Tenders) -> TenderVersion:
+    """
+    Функция для сохранения текущего состояния тендера в историю версий.
+    Через нее проходит любая запись тендера, поэтому здесь же сбрасывается кэш списка тендеров
+    """
+    tender_list_cache.bump_generation()
+    return TenderVersion.objects.create(
+        tenderId_id=tender.tenderId,
+        tenderName=tender.tenderName,
+        tenderDescription=tender.tenderDescription,
+        tenderServiceType=tender.tenderServiceType,
+        tenderStatus=tender.tenderStatus,
+        tenderVersion=tender.tenderVersion,
+    )
+
+
+def save_bid_version(bid: Bids) -> BidVersion:
+    """ Функция для сохранения текущего состояния предложения в историю версий """
+    return BidVersion.objects.create(
+        bidId_id=bid.bidId,
+        bidName=bid.bidName,
+        bidDescription=bid.bidDescription,
+        bidStatus=bid.bidStatus,
+        bidDecision=bid.bidDecision,
+        bidVersion=bid.bidVersion,
+    )
+
+
+@transaction.atomic
+def update_tender(tender: Tenders, **changes) -> Tenders:
+    """
+    Функция для изменения тендера новой версией.
+    Выполняет один UPDATE только измененных колонок с условием на прочитанную версию
+    (UPDATE ... SET version = version + 1 WHERE id = ? AND version = ?) и сохраняет версию в историю.
+    Выбрасывает VersionConflict, если тендер уже изменили
+    """
+    expected_version = tender.tenderVersion
+    updated = Tenders.objects.filter(tenderId=tender.tenderId, tenderVersion=expected_version).update(
+        tenderVersion=F("tenderVersion") + 1, **changes
+    )
+    if not updated:
+        raise VersionConflict(f"Тендер изменен, текущая версия больше {expected_version}")
+    for field, value in changes.items():
+        setattr(tender, field, value)
+    tender.tenderVersion = expected_version + 1
+    save_tender_version(tender)
+    return tender
+
+
+@transaction.atomic
+def update_bid(bid: Bids, **changes) -> Bids:
+    """ Функция для изменения предложения новой версией, работает как update_tender """
+    expected_version = bid.bidVersion
+    updated = Bids.objects.filter(bidId=bid.bidId, bidVersion=expected_version).update(
+        bidVersion=F("bidVersion") + 1, **changes
+    )
+    if not updated:
+        raise VersionConflict(f"Предложение изменено, текущая версия больше {expected_version}")
+    for field, value in changes.items():
+        setattr(bid, field, value)
+    bid.bidVersion = expected_version + 1
+    save_bid_version(bid)
+    return bid
+
+
+@transaction.atomic
+def rollback_tender(tender: Tenders, version: int) -> Tenders:
+    """
+    Функция для отката тендера к сохраненной версии.
+    Откат считается новой правкой: параметры берутся из версии, а номер версии увеличивается.
+    Статус остается текущим: откат не должен открывать закрытый тендер с уже согласованным предложением.
+    Выбрасывает TenderVersion.DoesNotExist, если такой версии нет
+    """
+    snapshot = TenderVersion.objects.get(tenderId_id=tender.tenderId, tenderVersion=version)
+    return update_tender(
+        tender,
+        tenderName=snapshot.tenderName,
+        tenderDescription=snapshot.tenderDescription,
+        tenderServiceType=snapshot.tenderServiceType,
+    )
+
+
+@transaction.atomic
+def rollback_bid(bid: Bids, version: int) -> Bids:
+    """
+    Функция для отката предложения к сохраненной версии, работает как rollback_tender.
+    Статус и решение остаются текущими: их меняют только публикация, отмена и согласование.
+    Выбрасывает BidVersion.DoesNotExist, если такой версии нет
+    """
+    snapshot = BidVersion.objects.get(bidId_id=bid.bidId, bidVersion=version)
+    return update_bid(
+        bid,
+        bidName=snapshot.bidName,
+        bidDescription=snapshot.bidDescription,
+    )
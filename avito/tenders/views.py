@@ -1,15 +1,112 @@
+import uuid
+from typing import Optional
+
 from rest_framework.generics import ListAPIView
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.status import HTTP_401_UNAUTHORIZED, HTTP_400_BAD_REQUEST, HTTP_200_OK, HTTP_404_NOT_FOUND, \
-    HTTP_500_INTERNAL_SERVER_ERROR, HTTP_403_FORBIDDEN
+    HTTP_500_INTERNAL_SERVER_ERROR, HTTP_403_FORBIDDEN, HTTP_409_CONFLICT, HTTP_304_NOT_MODIFIED
 from rest_framework.views import APIView
-from django.core.exceptions import ObjectDoesNotExist, ValidationError
-
+from django.db import transaction
+from django.db.models import QuerySet
+from django.http import HttpRequest, HttpResponse, QueryDict
+from django.http.response import HttpResponseBase
+
+from .bulk import BULK_MAX_ITEMS, bulk_create_tenders, bulk_create_bids
+from .cache import identity_cache, tender_list_cache
+from .db_metrics import pool_stats
+from .decisions import DecisionError, submit_decision
+from .etags import conditional_result, entity_etag, etag_rows, serialize_page, unchanged_page_etag
+from .exports import EXPORT_RENDERERS, export_error, export_response, stream_rows
 from .filters import TenderFilter
-from .models import Tenders, Employee, Bids, Organization, OrganizationResponsible, Reviews
+from .identity import get_identity, get_identity_by_id, parse_uuid, tender_access_error, bid_access_error
+from .metrics import metrics_registry
+from .models import Tenders, Bids, Reviews, TenderVersion, BidVersion
 from .pagination import CustomPagination
-from .serializers import TenderSerializer
+from .renderers import PrometheusRenderer
+from .routers import use_primary
+from .search import search_from_params
+from .serializers import FastSerializer, TenderSerializer, tender_serializer, tender_version_serializer, \
+    bid_serializer, bid_version_serializer, review_serializer
+from .versioning import VersionConflict, save_tender_version, save_bid_version, update_tender, update_bid, \
+    rollback_tender, rollback_bid
+
+TENDER_STATUSES = {status for status, _ in Tenders.TENDER_STATUS}
+BID_STATUSES = {status for status, _ in Bids.BIDS_STATUS}
+
+
+def bulk_items_error(request: Request) -> Optional[Response]:
+    """ Функция для проверки тела пакетного запроса, возвращает ответ с ошибкой или None """
+    if not isinstance(request.data, list) or not request.data:
+        return Response({"reason": "Тело запроса должно быть непустым JSON-массивом."},
+                        status=HTTP_400_BAD_REQUEST)
+    if len(request.data) > BULK_MAX_ITEMS:
+        return Response({"reason": f"В одном запросе можно передать не больше {BULK_MAX_ITEMS} элементов."},
+                        status=HTTP_400_BAD_REQUEST)
+    return None
+
+
+def tender_list_filter(query_params: QueryDict) -> TenderFilter:
+    """ Функция для получения фильтра публичного списка тендеров, строки идут в порядке списка """
+    return TenderFilter(query_params, queryset=Tenders.objects.order_by("tenderName", "tenderId"))
+
+
+def api_not_found(request: HttpRequest, *args, **kwargs) -> HttpResponse:
+    """
+    Функция для ответа 404 в JSON на адреса API без маршрута, в том числе с некорректным UUID в пути.
+    Подключается последним маршрутом tenders/urls.py, поэтому работает и при DEBUG, в отличие от handler404
+    """
+    return export_error({"reason": "Ресурс не найден"}, HTTP_404_NOT_FOUND)
+
+
+def not_modified(etag: str) -> Response:
+    """ Функция для ответа 304 без тела, если у клиента актуальная версия ответа """
+    response = Response(status=HTTP_304_NOT_MODIFIED)
+    response["ETag"] = etag
+    return response
+
+
+def result_response(result: tuple) -> Response:
+    """ Функция для ответа по (статус, данные, заголовки) из conditional_result """
+    status, data, headers = result
+    return Response(data, status=status, headers=headers)
+
+
+def conditional_page(request: Request, queryset: QuerySet, serializer: FastSerializer) -> Response:
+    """
+    Функция для ответа страницей списка с ETag.
+    Если клиент прислал If-None-Match, сначала выбираются только id, версии и ключ сортировки строк страницы,
+    и при совпадении ETag возвращается 304 без выборки и сериализации полных строк
+    """
+    paginator = CustomPagination()
+    if_none_match = request.META.get("HTTP_IF_NONE_MATCH")
+    if if_none_match:
+        keys = paginator.paginate_queryset(etag_rows(queryset, serializer), request)
+        etag = unchanged_page_etag(if_none_match, keys, paginator.next_cursor)
+        if etag is not None:
+            return not_modified(etag)
+    rows = paginator.paginate_queryset(serializer.rows(queryset), request)
+    return result_response(conditional_result(None, *serialize_page(serializer, rows, paginator.next_cursor)))
+
+
+def tender_access_denied(request: Request, tender: Tenders, username: str) -> Optional[Response]:
+    """ Функция для проверки прав пользователя на тендер, возвращает ответ с ошибкой или None """
+    error = tender_access_error(get_identity(request, username), tender)
+    return None if error is None else Response(status=error[0], data=error[1])
+
+
+def bid_access_denied(request: Request, bid: Bids, username: str) -> Optional[Response]:
+    """ Функция для проверки прав пользователя на предложение, возвращает ответ с ошибкой или None """
+    error = bid_access_error(get_identity(request, username), bid)
+    return None if error is None else Response(status=error[0], data=error[1])
+
+
+class PrometheusMetricsAPIView(APIView):
+    """ Класс для выдачи метрик маршрутов в формате Prometheus """
+    renderer_classes = [PrometheusRenderer]
+
+    def get(self, request: Request) -> Response:
+        return Response(metrics_registry.render(), content_type="text/plain; version=0.0.4; charset=utf-8")
 
 
 class PingAPIView(APIView):
@@ -22,6 +119,26 @@ class PingAPIView(APIView):
             return Response(status=HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+class DatabaseMetricsAPIView(APIView):
+    """ Класс для получения метрик соединений с базой и насыщения пула """
+
+    def get(self, request: Request) -> Response:
+        try:
+            return Response(status=HTTP_200_OK, data=pool_stats())
+        except Exception as e:
+            return Response(status=HTTP_500_INTERNAL_SERVER_ERROR, data={"reason": str(e)})
+
+
+class CacheMetricsAPIView(APIView):
+    """ Класс для получения статистики кэшей пользователей и списка тендеров """
+
+    def get(self, request: Request) -> Response:
+        return Response(status=HTTP_200_OK, data={
+            "identity": identity_cache.stats(),
+            "tenderList": tender_list_cache.stats(),
+        })
+
+
 class TendersAPIView(ListAPIView):
     """ Класс для получения списка тендеров """
     pagination_class = CustomPagination
@@ -30,17 +147,35 @@ class TendersAPIView(ListAPIView):
 
     # filter_backends = (DjangoFilterBackend,)
 
-    def get_queryset(self):
-        try:
-            service_types: str = self.request.query_params.get('service_type')
-            queryset = Tenders.objects.all()
-
-            if service_types:
-                queryset = queryset.filter(tenderServiceType=service_types)
-            return queryset
-        except Exception as e:
-            return Response({"reason": f"{str(e)} Неверный формат запроса или его параметры."},
+    def list(self, request: Request, *args, **kwargs) -> Response:
+        filterset = tender_list_filter(request.query_params)
+        if not filterset.is_valid():
+            return Response({"reason": "Неверный формат запроса или его параметры."},
                             status=HTTP_400_BAD_REQUEST)
+        key = tender_list_cache.key(request.query_params)
+        page = tender_list_cache.get(key)
+        if page is None:
+            # Страница для кэша читается из основной базы, чтобы не закэшировать отставание реплики
+            with use_primary():
+                rows = self.paginate_queryset(tender_serializer.rows(filterset.qs))
+            page = serialize_page(tender_serializer, rows, self.paginator.next_cursor)
+            tender_list_cache.set(key, page)
+        return result_response(conditional_result(request.META.get("HTTP_IF_NONE_MATCH"), *page))
+
+
+class TendersExportAPIView(APIView):
+    """
+    Класс для потоковой выгрузки публичного списка тендеров в NDJSON или CSV.
+    Фильтры и порядок строк те же, что у /tenders, но выгружаются все строки без пагинации
+    """
+    renderer_classes = EXPORT_RENDERERS
+
+    def get(self, request: Request) -> HttpResponseBase:
+        filterset = tender_list_filter(request.query_params)
+        if not filterset.is_valid():
+            return export_error({"reason": "Неверный формат запроса или его параметры."}, HTTP_400_BAD_REQUEST)
+        renderer = request.accepted_renderer
+        return export_response(stream_rows(filterset.qs, tender_serializer, renderer), renderer, "tenders")
 
 
 class TendersNewAPIView(APIView):
@@ -49,36 +184,30 @@ class TendersNewAPIView(APIView):
     # permission_classes = [permissions.IsAuthenticated]
 
     def post(self, request: Request) -> Response:
-        request_username = request.data.get("creatorUsername")
-        try:
-            db_username = Employee.objects.get(username=request_username).username
-        except ObjectDoesNotExist:
-            db_username = None
+        identity = get_identity(request, request.data.get("creatorUsername"))
         try:
             if request.method == "POST":
-                if request_username == db_username:
+                if identity is not None:
+                    if not identity.is_responsible_for(request.data.get("organizationId")):
+                        return Response(status=HTTP_403_FORBIDDEN,
+                                        data={"reason": "Недостаточно прав для выполнения действия."})
                     try:
-                        tender = Tenders.objects.create(
-                            tenderName=request.data.get("name"),
-                            tenderDescription=request.data.get("description"),
-                            tenderServiceType=request.data.get("serviceType"),
-                            organizationId=request.data.get("organizationId"),
-                            creatorUsername=request.data.get("creatorUsername")
-                        )
-                        response_data = {
-                            "id": tender.tenderId,
-                            "name": tender.tenderName,
-                            "description": tender.tenderDescription,
-                            "service_type": tender.tenderServiceType,
-                            "status": tender.tenderStatus,
-                            "version": tender.tenderVersion,
-                            "createdAt": tender.createdAt.strftime('%Y-%m-%dT%H:%M:%SZ')
-                        }
+                        with transaction.atomic():
+                            tender = Tenders.objects.create(
+                                tenderName=request.data.get("name"),
+                                tenderDescription=request.data.get("description"),
+                                tenderServiceType=request.data.get("serviceType"),
+                                tenderStatus="Created",
+                                organizationId_id=parse_uuid(request.data.get("organizationId")),
+                                creatorUsername=request.data.get("creatorUsername")
+                            )
+                            save_tender_version(tender)
+                        response_data = tender_serializer.serialize(tender)
                         return Response(status=HTTP_200_OK, data=response_data)
                     except Exception as e:
                         return Response({"reason": f"{str(e)} Неверный формат запроса или его параметры."},
                                         status=HTTP_400_BAD_REQUEST)
-                elif db_username is None:
+                else:
                     reason = {"reason": "Пользователь не существует или некорректен"}
                     return Response(status=HTTP_401_UNAUTHORIZED, data=reason)
         except Exception as e:
@@ -86,52 +215,60 @@ class TendersNewAPIView(APIView):
             return Response(status=HTTP_500_INTERNAL_SERVER_ERROR, data=reason)
 
 
+class TendersBulkAPIView(APIView):
+    """ Класс для создания тендеров пачкой, результат возвращается для каждого элемента """
+
+    def post(self, request: Request) -> Response:
+        error = bulk_items_error(request)
+        if error is not None:
+            return error
+        try:
+            return Response(status=HTTP_200_OK, data=bulk_create_tenders(request.data))
+        except Exception as e:
+            reason = {"reason": f"Ошибка при создании тендеров: {str(e)}"}
+            return Response(status=HTTP_500_INTERNAL_SERVER_ERROR, data=reason)
+
+
 class TendersStatusAPIView(APIView):
     """ Класс для получения и изменения текущего статуса """
 
     # permission_classes = [permissions.IsAuthenticated, ]
 
-    def get(self, request: Request, tenderId: str) -> Response:
+    def get(self, request: Request, tenderId: uuid.UUID) -> Response:
         user = request.query_params.get("username")
         try:
-            tender = Tenders.objects.get(tenderId=tenderId)
-            if user == tender.creatorUsername:
-                return Response(data=tender.status, status=HTTP_200_OK)
-            else:
-                return Response(data={"reason": "Пользователь не существует или некорректен."},
-                                status=HTTP_401_UNAUTHORIZED)
+            tender = Tenders.objects.only("tenderId", "tenderStatus", "tenderVersion", "creatorUsername",
+                                          "organizationId").get(tenderId=tenderId)
+            denied = tender_access_denied(request, tender, user)
+            if denied is not None:
+                return denied
+            return result_response(conditional_result(request.META.get("HTTP_IF_NONE_MATCH"), tender.tenderStatus,
+                                                      None, entity_etag(tender.tenderId, tender.tenderVersion)))
 
         except Tenders.DoesNotExist:
             return Response(data={"reason": "Тендер не найден"},
                             status=HTTP_404_NOT_FOUND)
 
-    def put(self, request: Request, tenderId: str) -> Response:
+    def put(self, request: Request, tenderId: uuid.UUID) -> Response:
         user = request.query_params.get("username")
+        new_status = request.query_params.get("status")
+        if new_status not in TENDER_STATUSES:
+            return Response(status=HTTP_400_BAD_REQUEST, data={"reason": "Некорректный статус тендера."})
         try:
             status = Tenders.objects.get(tenderId=tenderId)
-            if user == status.creatorUsername:
-                try:
-                    new_status = request.query_params["status"]
-                    status.tenderStatus = new_status
-                    status.tenderVersion += 1
-                    status.save()
-
-                    response_data = {
-                        "id": status.tenderId,
-                        "name": status.tenderName,
-                        "description": status.tenderDescription,
-                        "status": status.tenderStatus,
-                        "serviceType": status.tenderServiceType,
-                        "version": status.tenderVersion,
-                        "createdAt": status.createdAt.strftime('%Y-%m-%dT%H:%M:%SZ'),
-                    }
-                    return Response(status=HTTP_200_OK, data=response_data)
-                except Exception as e:
-                    return Response({"reason": f"{str(e)} Неверный формат запроса или его параметры."},
-                                    status=HTTP_400_BAD_REQUEST)
-            else:
-                return Response(data={"reason": "Пользователь не существует или некорректен."},
-                                status=HTTP_401_UNAUTHORIZED)
+            denied = tender_access_denied(request, status, user)
+            if denied is not None:
+                return denied
+            try:
+                status = update_tender(status, tenderStatus=new_status)
+
+                response_data = tender_serializer.serialize(status)
+                return Response(status=HTTP_200_OK, data=response_data)
+            except VersionConflict as e:
+                return Response({"reason": str(e)}, status=HTTP_409_CONFLICT)
+            except Exception as e:
+                return Response({"reason": f"{str(e)} Неверный формат запроса или его параметры."},
+                                status=HTTP_400_BAD_REQUEST)
         except Tenders.DoesNotExist:
             return Response(data={"reason": "Тендер не найден"},
                             status=HTTP_404_NOT_FOUND)
@@ -142,41 +279,33 @@ class TendersEditAPIView(APIView):
 
     # permission_classes = [permissions.IsAuthenticated, ]
 
-    def patch(self, request: Request, tenderId: str) -> Response:
+    def patch(self, request: Request, tenderId: uuid.UUID) -> Response:
         user = request.query_params.get("username")
         try:
             tender = Tenders.objects.get(tenderId=tenderId)
-            if user == tender.creatorUsername:
-                try:
-                    if "name" in request.data:
-                        tender.tenderName = request.data.get("name")
-
-                    if "description" in request.data:
-                        tender.tenderDescription = request.data.get("description")
-
-                    if "serviceType" in request.data:
-                        tender.tenderServiceType = request.data.get("serviceType")
-
-                    tender.version += 1
-
-                    tender.save()
-
-                    response_data = {
-                        "id": tender.tenderId,
-                        "name": tender.tenderName,
-                        "description": tender.tenderDescription,
-                        "status": tender.tenderStatus,
-                        "serviceType": tender.tenderServiceType,
-                        "version": tender.tenderVersion,
-                        "createdAt": tender.createdAt.strftime('%Y-%m-%dT%H:%M:%SZ')
-                    }
-                    return Response(status=HTTP_200_OK, data=response_data)
-                except Exception as e:
-                    return Response({"reason": f"{str(e)} Неверный формат запроса или его параметры."},
-                                    status=HTTP_400_BAD_REQUEST)
-            else:
-                return Response(data={"reason": "Пользователь не существует или некорректен."},
-                                status=HTTP_401_UNAUTHORIZED)
+            denied = tender_access_denied(request, tender, user)
+            if denied is not None:
+                return denied
+            try:
+                changes = {}
+                if "name" in request.data:
+                    changes["tenderName"] = request.data.get("name")
+
+                if "description" in request.data:
+                    changes["tenderDescription"] = request.data.get("description")
+
+                if "serviceType" in request.data:
+                    changes["tenderServiceType"] = request.data.get("serviceType")
+
+                tender = update_tender(tender, **changes)
+
+                response_data = tender_serializer.serialize(tender)
+                return Response(status=HTTP_200_OK, data=response_data)
+            except VersionConflict as e:
+                return Response({"reason": str(e)}, status=HTTP_409_CONFLICT)
+            except Exception as e:
+                return Response({"reason": f"{str(e)} Неверный формат запроса или его параметры."},
+                                status=HTTP_400_BAD_REQUEST)
         except Tenders.DoesNotExist:
             return Response(data={"reason": "Тендер не найден"},
                             status=HTTP_404_NOT_FOUND)
@@ -187,36 +316,56 @@ class TendersRollbackVersionAPIView(APIView):
 
     # permission_classes = [permissions.IsAuthenticated, ]
 
-    def put(self, request: Request, tenderId: str, version: int):
+    def put(self, request: Request, tenderId: uuid.UUID, version: int):
         user = request.query_params.get("username")
         try:
             tender = Tenders.objects.get(tenderId=tenderId)
-            if user == tender.creatorUsername:
-                try:
-
-                    tender.tenderVersion = version
-                    tender.save()
-
-                    response_data = {
-                        "id": tender.tenderId,
-                        "name": tender.tenderName,
-                        "description": tender.tenderDescription,
-                        "status": tender.tenderStatus,
-                        "serviceType": tender.tenderServiceType,
-                        "version": tender.tenderVersion,
-                        "createdAt": tender.createdAt.strftime('%Y-%m-%dT%H:%M:%SZ')
-                    }
-
-                    return Response(status=HTTP_200_OK, data=response_data)
-                except Exception as e:
-                    return Response({"reason": f"{str(e)} Неверный формат запроса или его параметры."},
-                                    status=HTTP_400_BAD_REQUEST)
-            else:
-                return Response(data={"reason": "Пользователь не существует или некорректен."},
-                                status=HTTP_401_UNAUTHORIZED)
+            denied = tender_access_denied(request, tender, user)
+            if denied is not None:
+                return denied
+            try:
+                tender = rollback_tender(tender, version)
+
+                response_data = tender_serializer.serialize(tender)
+
+                return Response(status=HTTP_200_OK, data=response_data)
+            except TenderVersion.DoesNotExist:
+                return Response(data={"reason": "Версия тендера не найдена"},
+                                status=HTTP_404_NOT_FOUND)
+            except VersionConflict as e:
+                return Response({"reason": str(e)}, status=HTTP_409_CONFLICT)
+            except Exception as e:
+                return Response({"reason": f"{str(e)} Неверный формат запроса или его параметры."},
+                                status=HTTP_400_BAD_REQUEST)
+        except Tenders.DoesNotExist:
+            return Response(data={"reason": "Тендер не найден"},
+                            status=HTTP_404_NOT_FOUND)
+
+
+class TendersHistoryAPIView(APIView):
+    """ Класс для просмотра истории версий тендера """
+
+    # permission_classes = [permissions.IsAuthenticated, ]
+
+    def get(self, request: Request, tenderId: uuid.UUID) -> Response:
+        user = request.query_params.get("username")
+        try:
+            tender = Tenders.objects.only("tenderId", "creatorUsername", "organizationId").get(tenderId=tenderId)
         except Tenders.DoesNotExist:
             return Response(data={"reason": "Тендер не найден"},
                             status=HTTP_404_NOT_FOUND)
+        denied = tender_access_denied(request, tender, user)
+        if denied is not None:
+            return denied
+
+        paginator = CustomPagination()
+        versions = paginator.paginate_queryset(
+            tender_version_serializer.rows(
+                TenderVersion.objects.filter(tenderId_id=tenderId).order_by("tenderVersion")
+            ),
+            request, view=self
+        )
+        return paginator.get_paginated_response(tender_version_serializer.serialize_rows(versions))
 
 
 class UserTendersListAPIView(APIView):
@@ -224,27 +373,12 @@ class UserTendersListAPIView(APIView):
 
     def get(self, request):
         user = request.query_params.get("username")
-        limit = int(request.GET.get('limit', 5))
-        offset = int(request.GET.get('offset', 0))
-
-        tenders = Tenders.objects.filter(creatorUsername=user).order_by('tenderName')[offset:offset + limit]
-        if not tenders:
+        if get_identity(request, user) is None:
             return Response(data={"reason": "Пользователь не существует или некорректен."},
                             status=HTTP_401_UNAUTHORIZED)
 
-        serialized_tenders = []
-        for tender in tenders:
-            serialized_tender = {
-                "id": tender.tenderId,
-                "name": tender.tenderName,
-                "description": tender.tenderDescription,
-                "status": tender.tenderStatus,
-                "serviceType": tender.tenderServiceType,
-                "version": tender.tenderVersion,
-                "createdAt": tender.createdAt.strftime('%Y-%m-%dT%H:%M:%SZ')
-            }
-            serialized_tenders.append(serialized_tender)
-        return Response(serialized_tenders, status=HTTP_200_OK)
+        queryset = Tenders.objects.filter(creatorUsername=user).order_by("tenderName", "tenderId")
+        return conditional_page(request, queryset, tender_serializer)
 
 
 class BidsNewAPIView(APIView):
@@ -253,36 +387,36 @@ class BidsNewAPIView(APIView):
     # permission_classes = [permissions.IsAuthenticated, ]
 
     def post(self, request: Request):
-        try:
-            user = Employee.objects.get(id=request.data.get("authorId"))
-        except Employee.DoesNotExist:
+        identity = get_identity_by_id(request, request.data.get("authorId"))
+        if identity is None:
             reason = {
                 "reason": "Пользователь не существует или некорректен"
             }
             return Response(status=HTTP_401_UNAUTHORIZED, data=reason)
+        if not identity.organization_ids:
+            return Response(status=HTTP_403_FORBIDDEN,
+                            data={"reason": "Недостаточно прав для выполнения действия."})
 
+        tender_id = parse_uuid(request.data.get("tenderId"))
+        if tender_id is None:
+            return Response(data={"reason": "Тендер не найден"},
+                            status=HTTP_404_NOT_FOUND)
         try:
-            tender = Tenders.objects.get(tenderId=request.data.get("tenderId"))
-            organization = OrganizationResponsible.objects.get(user_id=user)
-
-            bids = Bids.objects.create(
-                bidName=request.data.get("name"),
-                bidDescription=request.get("description"),
-                tenderId=tender,
-                authorType=request.data.get("authorType"),
-                organizationId=organization.organization_id,
-                authorId=user
-            )
-
-            response_data = {
-                "id": bids.bidId,
-                "name": bids.bidName,
-                "status": bids.bidStatus,
-                "authorType": bids.bidAuthorType,
-                "authorId": bids.bidAuthorId.id,
-                "version": bids.bidVersion,
-                "createdAt": bids.createdAt.strftime('%Y-%m-%dT%H:%M:%SZ')
-            }
+            tender = Tenders.objects.only("tenderId").get(tenderId=tender_id)
+
+            with transaction.atomic():
+                bids = Bids.objects.create(
+                    bidName=request.data.get("name"),
+                    bidDescription=request.data.get("description"),
+                    bidStatus="Created",
+                    tenderId=tender,
+                    bidAuthorType=request.data.get("authorType"),
+                    organizationId_id=next(iter(identity.organization_ids)),
+                    bidAuthorId_id=identity.employee_id
+                )
+                save_bid_version(bids)
+
+            response_data = bid_serializer.serialize(bids)
 
             return Response(status=HTTP_200_OK, data=response_data)
 
@@ -291,34 +425,32 @@ class BidsNewAPIView(APIView):
                             status=HTTP_404_NOT_FOUND)
 
 
+class BidsBulkAPIView(APIView):
+    """ Класс для создания предложений пачкой, результат возвращается для каждого элемента """
+
+    def post(self, request: Request) -> Response:
+        error = bulk_items_error(request)
+        if error is not None:
+            return error
+        try:
+            return Response(status=HTTP_200_OK, data=bulk_create_bids(request.data))
+        except Exception as e:
+            reason = {"reason": f"Ошибка при создании предложений: {str(e)}"}
+            return Response(status=HTTP_500_INTERNAL_SERVER_ERROR, data=reason)
+
+
 class BidsMyAPIView(APIView):
     """ Класс для получения списка предложений пользователя  """
 
     def get(self, request: Request) -> Response:
         user = request.query_params.get("username")
-        limit = int(request.GET.get('limit', 5))
-        offset = int(request.GET.get('offset', 0))
-        my_user = Employee.objects.get(username=user)
-
-        bids = Bids.objects.filter(authorId=my_user.id).order_by('bidName')[offset:offset + limit]
-        if not bids:
+        my_user = get_identity(request, user)
+        if my_user is None:
             return Response(data={"reason": "Пользователь не существует или некорректен."},
                             status=HTTP_401_UNAUTHORIZED)
 
-        serialized_tenders = []
-        for bid in bids:
-            serialized_tender = {
-                "id": bid.bidId,
-                "name": bid.bidName,
-                "status": bid.bidStatus,
-                "authorType": bid.bidAuthorType,
-                'authorId': bid.bidAuthorId.id,
-                "version": bid.bidVersion,
-                "createdAt": bid.createdAt.strftime('%Y-%m-%dT%H:%M:%SZ')
-            }
-            serialized_tenders.append(serialized_tender)
-
-        return Response(serialized_tenders, status=HTTP_200_OK)
+        queryset = Bids.objects.filter(bidAuthorId_id=my_user.employee_id).order_by("bidName", "bidId")
+        return conditional_page(request, search_from_params(queryset, request.query_params), bid_serializer)
 
 
 class BidsTendersListAPIView(APIView):
@@ -326,35 +458,15 @@ class BidsTendersListAPIView(APIView):
 
     # permission_classes = [permissions.IsAuthenticated, ]
 
-    def get(self, request: Request, tenderId: str) -> Response:
+    def get(self, request: Request, tenderId: uuid.UUID) -> Response:
         user = request.query_params.get("username")
-        limit = int(request.GET.get('limit', 5))
-        offset = int(request.GET.get('offset', 0))
         try:
-            tender = Tenders.objects.get(tenderId=tenderId)
-            bids = Bids.objects.filter(tenderId=tenderId).order_by("bidName")[offset:offset + limit]
-            if user == tender.creatorUsername:
-                try:
-                    serialized_tenders = []
-                    for bid in bids:
-                        serialized_tender = {
-                            "id": bid.bidId,
-                            "name": bid.bidName,
-                            "status": bid.bidStatus,
-                            "authorType": bid.bidAuthorType,
-                            "authorId": bid.bidAuthorId.id,
-                            "version": bid.bidVersion,
-                            "createdAt": bid.createdAt.strftime('%Y-%m-%dT%H:%M:%SZ')
-                        }
-                        serialized_tenders.append(serialized_tender)
-
-                    return Response(status=HTTP_200_OK, data=serialized_tenders)
-                except Exception as e:
-                    return Response({"reason": f"{str(e)} Неверный формат запроса или его параметры."},
-                                    status=HTTP_400_BAD_REQUEST)
-            else:
-                return Response(data={"reason": "Пользователь не существует или некорректен."},
-                                status=HTTP_401_UNAUTHORIZED)
+            tender = Tenders.objects.only("tenderId", "creatorUsername", "organizationId").get(tenderId=tenderId)
+            denied = tender_access_denied(request, tender, user)
+            if denied is not None:
+                return denied
+            queryset = Bids.objects.filter(tenderId=tenderId).order_by("bidName", "bidId")
+            return conditional_page(request, queryset, bid_serializer)
         except Bids.DoesNotExist:
             return Response(data={"reason": "Предложение не найдено"},
                             status=HTTP_404_NOT_FOUND)
@@ -363,63 +475,68 @@ class BidsTendersListAPIView(APIView):
                             status=HTTP_404_NOT_FOUND)
 
 
+class BidsExportAPIView(APIView):
+    """
+    Класс для потоковой выгрузки всех предложений по тендеру в NDJSON или CSV, права как у списка предложений.
+    Ошибки отдаются в JSON, а не в формате выгрузки
+    """
+    renderer_classes = EXPORT_RENDERERS
+
+    def get(self, request: Request, tenderId: uuid.UUID) -> HttpResponseBase:
+        user = request.query_params.get("username")
+        try:
+            tender = Tenders.objects.only("tenderId", "creatorUsername", "organizationId").get(tenderId=tenderId)
+        except Tenders.DoesNotExist:
+            return export_error({"reason": "Тендер не найден"}, HTTP_404_NOT_FOUND)
+        denied = tender_access_denied(request, tender, user)
+        if denied is not None:
+            return export_error(denied.data, denied.status_code)
+        queryset = Bids.objects.filter(tenderId=tenderId).order_by("bidName", "bidId")
+        renderer = request.accepted_renderer
+        return export_response(stream_rows(queryset, bid_serializer, renderer), renderer, f"bids-{tenderId}")
+
+
 class BidsStatusAPIView(APIView):
     """ Класс для получения и изменения статуса предложения """
 
     # permission_classes = [permissions.IsAuthenticated, ]
 
-    def get(self, request: Request, bidId: str) -> Response:
+    def get(self, request: Request, bidId: uuid.UUID) -> Response:
         user = request.query_params.get("username")
         try:
-            bid = Bids.objects.get(bidId=bidId)
-            if user == bid.authorId.username:
-                requUser = Employee.objects.get(username=user)
-                reqOrganization = OrganizationResponsible.objects.get(user_id=requUser)
-                if bid.organizationId != reqOrganization.organization_id:
-                    return Response(status=HTTP_403_FORBIDDEN,
-                                    data={"reason": "Недостаточно прав для выполнения действия."})
-                return Response(status=HTTP_200_OK, data=bid.bidStatus)
-            else:
-                return Response(data={"reason": "Пользователь не существует или некорректен."},
-                                status=HTTP_401_UNAUTHORIZED)
+            bid = Bids.objects.only("bidId", "bidStatus", "bidVersion", "bidAuthorId", "organizationId") \
+                .get(bidId=bidId)
+            denied = bid_access_denied(request, bid, user)
+            if denied is not None:
+                return denied
+            return result_response(conditional_result(request.META.get("HTTP_IF_NONE_MATCH"), bid.bidStatus,
+                                                      None, entity_etag(bid.bidId, bid.bidVersion)))
 
         except Bids.DoesNotExist:
             return Response(data={"reason": "Предложение не найдено"},
                             status=HTTP_404_NOT_FOUND)
 
-    def put(self, request: Request, bidId: str) -> Response:
+    def put(self, request: Request, bidId: uuid.UUID) -> Response:
         user = request.query_params.get("username")
+        status = request.query_params.get("status")
+        if status not in BID_STATUSES:
+            return Response(status=HTTP_400_BAD_REQUEST, data={"reason": "Некорректный статус предложения."})
         try:
             bid = Bids.objects.get(bidId=bidId)
-            if user == bid.bidAuthorId.username:
-                requUser = Employee.objects.get(username=user)
-                reqOrganization = OrganizationResponsible.objects.get(user_id=requUser)
-                if bid.organizationId != reqOrganization.organization_id:
-                    return Response(status=HTTP_403_FORBIDDEN,
-                                    data={"reason": "Недостаточно прав для выполнения действия."})
-                try:
-                    status = request.query_params.get("status")
-                    bid.bidVersion += 1
-                    bid.bidStatus = status
-                    bid.save()
-
-                    response_data = {
-                        "id": bid.bidId,
-                        "name": bid.bidName,
-                        "status": bid.bidStatus,
-                        "authorType": bid.bidAuthorType,
-                        "authorId": bid.bidAuthorId.id,
-                        "version": bid.bidVersion,
-                        "createdAt": bid.createdAt.strftime('%Y-%m-%dT%H:%M:%SZ')
-                    }
-
-                    return Response(status=HTTP_200_OK, data=response_data)
-                except Exception as e:
-                    return Response({"reason": f"{str(e)} Неверный формат запроса или его параметры."},
-                                    status=HTTP_400_BAD_REQUEST)
-            else:
-                return Response(data={"reason": "Пользователь не существует или некорректен."},
-                                status=HTTP_401_UNAUTHORIZED)
+            denied = bid_access_denied(request, bid, user)
+            if denied is not None:
+                return denied
+            try:
+                bid = update_bid(bid, bidStatus=status)
+
+                response_data = bid_serializer.serialize(bid)
+
+                return Response(status=HTTP_200_OK, data=response_data)
+            except VersionConflict as e:
+                return Response({"reason": str(e)}, status=HTTP_409_CONFLICT)
+            except Exception as e:
+                return Response({"reason": f"{str(e)} Неверный формат запроса или его параметры."},
+                                status=HTTP_400_BAD_REQUEST)
         except Bids.DoesNotExist:
             return Response(data={"reason": "Предложение не найдено"},
                             status=HTTP_404_NOT_FOUND)
@@ -430,42 +547,30 @@ class BidsEditAPIView(APIView):
 
     # permission_classes = [permissions.IsAuthenticated, ]
 
-    def patch(self, request: Request, bidId: str) -> Response:
+    def patch(self, request: Request, bidId: uuid.UUID) -> Response:
         user = request.query_params.get("username")
         try:
             bid = Bids.objects.get(bidId=bidId)
-            if user == bid.bidAuthorId.username:
-                requUser = Employee.objects.get(username=user)
-                reqOrganization = OrganizationResponsible.objects.get(user_id=requUser)
-                if bid.organizationId != reqOrganization.organization_id:
-                    return Response(status=HTTP_403_FORBIDDEN,
-                                    data={"reason": "Недостаточно прав для выполнения действия."})
-                try:
-                    if "name" in request.data:
-                        bid.bidName = request.data.get("name")
-                    if "description" in request.data:
-                        bid.bidDescription = request.data.get("description")
-
-                    bid.bidVersion += 1
-                    bid.save()
-
-                    response_data = {
-                        "id": bid.bidId,
-                        "name": bid.bidName,
-                        "status": bid.bidStatus,
-                        "authorType": bid.bidAuthorType,
-                        "authorId": bid.bidAuthorId.id,
-                        "version": bid.bidVersion,
-                        "createdAt": bid.createdAt.strftime('%Y-%m-%dT%H:%M:%SZ')
-                    }
-
-                    return Response(status=HTTP_200_OK, data=response_data)
-                except Exception as e:
-                    return Response({"reason": f"{str(e)} Неверный формат запроса или его параметры."},
-                                    status=HTTP_400_BAD_REQUEST)
-            else:
-                return Response(data={"reason": "Пользователь не существует или некорректен."},
-                                status=HTTP_401_UNAUTHORIZED)
+            denied = bid_access_denied(request, bid, user)
+            if denied is not None:
+                return denied
+            try:
+                changes = {}
+                if "name" in request.data:
+                    changes["bidName"] = request.data.get("name")
+                if "description" in request.data:
+                    changes["bidDescription"] = request.data.get("description")
+
+                bid = update_bid(bid, **changes)
+
+                response_data = bid_serializer.serialize(bid)
+
+                return Response(status=HTTP_200_OK, data=response_data)
+            except VersionConflict as e:
+                return Response({"reason": str(e)}, status=HTTP_409_CONFLICT)
+            except Exception as e:
+                return Response({"reason": f"{str(e)} Неверный формат запроса или его параметры."},
+                                status=HTTP_400_BAD_REQUEST)
         except Bids.DoesNotExist:
             return Response(data={"reason": "Предложение не найдено"},
                             status=HTTP_404_NOT_FOUND)
@@ -476,43 +581,32 @@ class BidsDecisionAPIView(APIView):
 
     # permission_classes = [permissions.IsAuthenticated, ]
 
-    def put(self, request: Request, bidId: str) -> Response:
+    def put(self, request: Request, bidId: uuid.UUID) -> Response:
         user = request.query_params.get("username")
         decision = request.query_params.get("decision")
+        if decision not in ("Approved", "Rejected"):
+            return Response(status=HTTP_400_BAD_REQUEST, data={"reason": "Решение не может быть отправлено"})
         try:
-            bid = Bids.objects.get(bidId=bidId)
-            if user == bid.bidAuthorId.username:
-                requUser = Employee.objects.get(username=user)
-                reqOrganization = OrganizationResponsible.objects.get(user_id=requUser)
-                if bid.organizationId != reqOrganization.organization_id:
-                    return Response(status=HTTP_403_FORBIDDEN,
-                                    data={"reason": "Недостаточно прав для выполнения действия."})
-                try:
-                    if decision in ["Approved", "Rejected"]:
-                        bid.bidDecision = decision
-                        bid.bidVersion += 1
-                        if decision == "Rejected":
-                            bid.bidStatus = "Canceled"
-                    else:
-                        return Response(status=HTTP_400_BAD_REQUEST, data="Решение не может быть отправлено")
-
-                    response_data = {
-                        "id": bid.bidId,
-                        "name": bid.bidName,
-                        "status": bid.bidStatus,
-                        "authorType": bid.bidAuthorType,
-                        "authorId": bid.bidAuthorId.id,
-                        "version": bid.bidVersion,
-                        "createdAt": bid.createdAt.strftime('%Y-%m-%dT%H:%M:%SZ')
-                    }
-                    bid.save()
-                    return Response(status=HTTP_200_OK, data=response_data)
-                except Exception as e:
-                    return Response({"reason": f"{str(e)} Неверный формат запроса или его параметры."},
-                                    status=HTTP_400_BAD_REQUEST)
-            else:
+            bid = Bids.objects.select_related("tenderId").get(bidId=bidId)
+            identity = get_identity(request, user)
+            if identity is None:
                 return Response(data={"reason": "Пользователь не существует или некорректен."},
                                 status=HTTP_401_UNAUTHORIZED)
+            if not identity.is_responsible_for(bid.tenderId.organizationId_id):
+                return Response(status=HTTP_403_FORBIDDEN,
+                                data={"reason": "Недостаточно прав для выполнения действия."})
+            try:
+                bid = submit_decision(bid, identity, decision)
+
+                response_data = bid_serializer.serialize(bid)
+                return Response(status=HTTP_200_OK, data=response_data)
+            except VersionConflict as e:
+                return Response({"reason": str(e)}, status=HTTP_409_CONFLICT)
+            except DecisionError as e:
+                return Response({"reason": str(e)}, status=HTTP_400_BAD_REQUEST)
+            except Exception as e:
+                return Response({"reason": f"{str(e)} Неверный формат запроса или его параметры."},
+                                status=HTTP_400_BAD_REQUEST)
         except Bids.DoesNotExist:
             return Response(data={"reason": "Предложение не найдено"},
                             status=HTTP_404_NOT_FOUND)
@@ -523,124 +617,123 @@ class BidsFeedbackAPIView(APIView):
 
     # permission_classes = [permissions.IsAuthenticated, ]
 
-    def put(self, request: Request, bidId: str):
+    def put(self, request: Request, bidId: uuid.UUID) -> Response:
         user = request.query_params.get("username")
+        feedback = request.query_params.get("bidFeedback")
         try:
-            bid = Bids.objects.get(bidId=bidId)
-            if user == bid.bidAuthorId.username:
-                requUser = Employee.objects.get(username=user)
-                reqOrganization = OrganizationResponsible.objects.get(user_id=requUser)
-                if bid.organizationId != reqOrganization.organization_id:
-                    return Response(status=HTTP_403_FORBIDDEN,
-                                    data={"reason": "Недостаточно прав для выполнения действия."})
-                try:
-                    review = Reviews.objects.create(
-                        bidReviewDescription=request.query_params.get("bidFeedback"),
-                        bidFeedback=bid
-                    )
-                    bid.version += 1
-
-                    response_data = {
-                        "id": bid.bidId,
-                        "name": bid.bidName,
-                        "status": bid.bidStatus,
-                        "authorType": bid.bidAuthorType,
-                        "authorId": bid.bidAuthorId.id,
-                        "version": bid.bidVersion,
-                        "createdAt": bid.createdAt.strftime('%Y-%m-%dT%H:%M:%SZ')
-                    }
-
-                    return Response(status=HTTP_200_OK, data=response_data)
-                except Exception as e:
-                    return Response({"reason": f"{str(e)} Неверный формат запроса или его параметры."},
-                                    status=HTTP_400_BAD_REQUEST)
-            else:
-                return Response(data={"reason": "Пользователь не существует или некорректен."},
-                                status=HTTP_401_UNAUTHORIZED)
+            bid = Bids.objects.select_related("tenderId").only(
+                "bidId", "bidName", "bidStatus", "bidAuthorType", "bidAuthorId", "bidVersion", "createdAt",
+                "tenderId__organizationId",
+            ).get(bidId=bidId)
         except Bids.DoesNotExist:
             return Response(data={"reason": "Предложение не найдено"},
                             status=HTTP_404_NOT_FOUND)
 
+        identity = get_identity(request, user)
+        if identity is None:
+            return Response(data={"reason": "Пользователь не существует или некорректен."},
+                            status=HTTP_401_UNAUTHORIZED)
+        if not identity.is_responsible_for(bid.tenderId.organizationId_id):
+            return Response(status=HTTP_403_FORBIDDEN,
+                            data={"reason": "Недостаточно прав для выполнения действия."})
+        if not feedback or len(feedback) > 1000:
+            return Response({"reason": "Отзыв должен быть непустой строкой до 1000 символов."},
+                            status=HTTP_400_BAD_REQUEST)
+
+        Reviews.objects.create(bidId_id=bid.bidId, authorId_id=bid.bidAuthorId_id, bidReviewDescription=feedback)
+        return Response(status=HTTP_200_OK, data=bid_serializer.serialize(bid))
+
 
 class BidsRollbackAPIView(APIView):
     """ Класс для отката версии предложения """
 
     # permission_classes = [permissions.IsAuthenticated, ]
 
-    def put(self, request: Request, bidId: str, version: int) -> Response:
+    def put(self, request: Request, bidId: uuid.UUID, version: int) -> Response:
         user = request.query_params.get("username")
         try:
             bid = Bids.objects.get(bidId=bidId)
-            if user == bid.bidAuthorId.username:
-                reqUser = Employee.objects.get(username=user)
-                reqOrganization = OrganizationResponsible.objects.get(user_id=reqUser)
-                if bid.organizationId != reqOrganization.organization_id:
-                    return Response(status=HTTP_403_FORBIDDEN,
-                                    data={"reason": "Недостаточно прав для выполнения действия"})
-
-                try:
-                    bid.bidVersion = version
-                    bid.save()
-                    response_data = {
-                        "id": bid.bidId,
-                        "name": bid.bidName,
-                        "status": bid.bidStatus,
-                        "authorType": bid.bidAuthorType,
-                        "authorId": bid.bidAuthorId.id,
-                        "version": bid.bidVersion,
-                        "createdAt": bid.createdAt.strftime('%Y-%m-%dT%H:%M:%SZ')
-                    }
-
-                    return Response(status=HTTP_200_OK, data=response_data)
-                except Exception as e:
-                    return Response({"reason": f"{str(e)} Неверный формат запроса или его параметры."},
-                                    status=HTTP_400_BAD_REQUEST)
-            else:
-                return Response(data={"reason": "Пользователь не существует или некорректен."},
-                                status=HTTP_401_UNAUTHORIZED)
+            denied = bid_access_denied(request, bid, user)
+            if denied is not None:
+                return denied
+
+            try:
+                bid = rollback_bid(bid, version)
+                response_data = bid_serializer.serialize(bid)
+
+                return Response(status=HTTP_200_OK, data=response_data)
+            except BidVersion.DoesNotExist:
+                return Response(data={"reason": "Версия предложения не найдена"},
+                                status=HTTP_404_NOT_FOUND)
+            except VersionConflict as e:
+                return Response({"reason": str(e)}, status=HTTP_409_CONFLICT)
+            except Exception as e:
+                return Response({"reason": f"{str(e)} Неверный формат запроса или его параметры."},
+                                status=HTTP_400_BAD_REQUEST)
         except Bids.DoesNotExist:
             return Response(data={"reason": "Предложение не найдено"},
                             status=HTTP_404_NOT_FOUND)
 
 
-class BidsReviewsAPIView(APIView):
-    """ Класс для просмотра отзывов на прошлые предложения """
+class BidsHistoryAPIView(APIView):
+    """ Класс для просмотра истории версий предложения """
 
     # permission_classes = [permissions.IsAuthenticated, ]
-    def get(self, request: Request, tenderId: str) -> Response:
-        authorUsername = request.query_params.get("authorUsername")
-        requesterUsername = request.query_params.get("requesterUsername")
-        limit = int(request.GET.get('limit', 5))
-        offset = int(request.GET.get('offset', 0))
 
+    def get(self, request: Request, bidId: uuid.UUID) -> Response:
+        user = request.query_params.get("username")
         try:
-            bids = Bids.objects.get(tenderId=tenderId)
+            bid = Bids.objects.only("bidId", "bidAuthorId", "organizationId").get(bidId=bidId)
         except Bids.DoesNotExist:
-            return Response({"reason": "Тендер не найден"}, status=HTTP_404_NOT_FOUND)
+            return Response(data={"reason": "Предложение не найдено"},
+                            status=HTTP_404_NOT_FOUND)
+        denied = bid_access_denied(request, bid, user)
+        if denied is not None:
+            return denied
 
-        requUser = Employee.objects.get(username=requesterUsername)
-        reqOrganization = OrganizationResponsible.objects.get(user_id=requUser)
-        if bids.organizationId != reqOrganization.organization_id:
-            return Response(status=HTTP_403_FORBIDDEN, data={"reason": "Недостаточно прав для выполнения действия."})
+        paginator = CustomPagination()
+        versions = paginator.paginate_queryset(
+            bid_version_serializer.rows(BidVersion.objects.filter(bidId_id=bidId).order_by("bidVersion")),
+            request, view=self
+        )
+        return paginator.get_paginated_response(bid_version_serializer.serialize_rows(versions))
 
-        if authorUsername is None or requesterUsername is None:
-            return Response({"reason": "Неверный формат запроса или его параметры"}, status=HTTP_400_BAD_REQUEST)
 
-        if authorUsername != bids.bidAuthorId.username:
-            return Response({"reason": "Пользователь не существует или некорректен"}, status=HTTP_401_UNAUTHORIZED)
+class BidsReviewsAPIView(APIView):
+    """ Класс для просмотра отзывов на прошлые предложения """
 
-        reviews = Reviews.objects.filter(bidFeedback=bids.bidId)[offset:offset + limit]
-        if not reviews:
-            return Response({"reason": "Отзывы не найдены"}, status=HTTP_404_NOT_FOUND)
+    # permission_classes = [permissions.IsAuthenticated, ]
+    def get(self, request: Request, tenderId: uuid.UUID) -> Response:
+        """
+        Ответственный за организацию тендера получает отзывы на все предложения автора,
+        который подал предложение на этот тендер. Отзывы читаются одним запросом
+        по индексу (authorId, createdAt, bidReviewId), с пагинацией по offset или по курсору
+        """
+        authorUsername = request.query_params.get("authorUsername")
+        requesterUsername = request.query_params.get("requesterUsername")
+        if authorUsername is None or requesterUsername is None:
+            return Response({"reason": "Неверный формат запроса или его параметры"}, status=HTTP_400_BAD_REQUEST)
 
-        serialized_reviews = []
-        for review in reviews:
-            serialized_review = {
-                "id": review.bidReviewId,
-                "description": review.bidReviewDescription,
-                "createdAt": review.createdAt.strftime('%Y-%m-%dT%H:%M:%SZ')
-            }
-            serialized_reviews.append(serialized_review)
+        try:
+            tender = Tenders.objects.only("tenderId", "organizationId").get(tenderId=tenderId)
+        except Tenders.DoesNotExist:
+            return Response({"reason": "Тендер не найден"}, status=HTTP_404_NOT_FOUND)
 
-        return Response(data=serialized_reviews, status=HTTP_200_OK)
+        requester = get_identity(request, requesterUsername)
+        author = get_identity(request, authorUsername)
+        if requester is None or author is None:
+            return Response({"reason": "Пользователь не существует или некорректен"}, status=HTTP_401_UNAUTHORIZED)
+        if not requester.is_responsible_for(tender.organizationId_id):
+            return Response(status=HTTP_403_FORBIDDEN, data={"reason": "Недостаточно прав для выполнения действия."})
+        if not Bids.objects.filter(tenderId_id=tenderId, bidAuthorId_id=author.employee_id).exists():
+            return Response({"reason": "Предложения автора по тендеру не найдены"}, status=HTTP_404_NOT_FOUND)
+
+        paginator = CustomPagination()
+        reviews = paginator.paginate_queryset(
+            review_serializer.rows(
+                Reviews.objects.filter(authorId_id=author.employee_id).order_by("createdAt", "bidReviewId")
+            ),
+            request, view=self
+        )
+        return paginator.get_paginated_response(review_serializer.serialize_rows(reviews))
 